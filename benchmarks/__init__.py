@@ -0,0 +1 @@
+# Benchmark offline per NEXUS-7 (nessun Discord reale, nessuna chiave Groq)
@@ -0,0 +1,147 @@
+"""
+Fake Discord Objects
+Oggetti Discord finti per far girare la pipeline dei messaggi offline
+"""
+
+from contextlib import asynccontextmanager
+
+from discord.ext import commands
+import discord
+
+
+class FakeUser:
+    """Utente Discord finto (autore di messaggi e comandi)"""
+
+    def __init__(self, user_id: int, name: str, bot: bool = False):
+        self.id = user_id
+        self.name = name
+        self.display_name = name
+        self.bot = bot
+        self.mention = f"<@{user_id}>"
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        """DM all'utente (registrato, mai inviato)"""
+        self.sent.append(content)
+
+    def __str__(self):
+        return self.name
+
+
+class FakeChannel:
+    """Canale finto che registra tutto quello che il bot invia"""
+
+    def __init__(self, channel_id: int, record: bool = False):
+        self.id = channel_id
+        self.record = record  # Tenere i messaggi in memoria falserebbe la misura della RAM
+        self.sent = []
+        self.sent_count = 0
+
+    async def send(self, content=None, **kwargs):
+        """Registra un messaggio inviato nel canale"""
+        self.sent_count += 1
+        if self.record:
+            self.sent.append({"content": content, **kwargs})
+
+    @asynccontextmanager
+    async def typing(self):
+        """Indicatore di scrittura (no-op)"""
+        yield
+
+
+class FakeMessage:
+    """Messaggio finto con le sole API usate dai cogs"""
+
+    def __init__(self, content: str, author: FakeUser, channel: FakeChannel):
+        self.content = content
+        self.author = author
+        self.channel = channel
+        self.guild = None
+        self._state = None  # Letto da commands.Context quando il bot processa i comandi
+
+    async def reply(self, content=None, **kwargs):
+        """Risposta al messaggio (va nel canale)"""
+        await self.channel.send(content, **kwargs)
+
+
+class FakeContext:
+    """Context finto per invocare i comandi ibridi direttamente"""
+
+    def __init__(self, bot, author: FakeUser, channel: FakeChannel):
+        self.bot = bot
+        self.author = author
+        self.channel = channel
+        self.guild = None
+        self.interaction = None
+
+    async def send(self, content=None, **kwargs):
+        """Risposta del comando (va nel canale)"""
+        await self.channel.send(content, **kwargs)
+
+    async def defer(self, **kwargs):
+        """Defer (no-op)"""
+
+
+class FakeBot(commands.Bot):
+    """Bot reale di discord.py che non si connette mai al gateway
+
+    Canali e utenti vengono risolti dai registri locali invece che via REST.
+    """
+
+    def __init__(self):
+        intents = discord.Intents.default()
+        intents.message_content = True
+        super().__init__(command_prefix='/', intents=intents)
+        self.fake_channels = {}
+        self.fake_users = {}
+
+    def add_fake_channel(self, channel: FakeChannel) -> FakeChannel:
+        self.fake_channels[channel.id] = channel
+        return channel
+
+    def add_fake_user(self, user: FakeUser) -> FakeUser:
+        self.fake_users[user.id] = user
+        return user
+
+    def get_channel(self, channel_id):
+        return self.fake_channels.get(channel_id)
+
+    def get_user(self, user_id):
+        return self.fake_users.get(user_id)
+
+    async def fetch_user(self, user_id):
+        user = self.fake_users.get(user_id)
+        if user is None:
+            raise discord.NotFound(_FakeResponse(404), "Unknown User")
+        return user
+
+
+class _FakeResponse:
+    """Risposta HTTP minima per costruire le eccezioni di discord.py"""
+
+    def __init__(self, status: int):
+        self.status = status
+        self.reason = "Not Found"
+
+
+class FakeGateway:
+    """Gateway finto: segna il bot come pronto e consegna i messaggi dal
+    ConnectionState, lo stesso percorso di MESSAGE_CREATE (filtro del gatekeeper compreso)"""
+
+    def __init__(self, bot: FakeBot, channel: FakeChannel):
+        self.bot = bot
+        self.channel = channel
+        self.delivered = 0
+
+    def connect(self, user: FakeUser = None):
+        """Equivalente di READY: imposta l'utente del bot, sblocca wait_until_ready() e chiama on_ready"""
+        self.bot._connection.user = user or FakeUser(1, "NEXUS-7", bot=True)
+        self.bot._handle_ready()
+        self.bot.dispatch('ready')
+
+    def deliver(self, author: FakeUser, content: str) -> FakeMessage:
+        """Un messaggio arriva nel canale"""
+        message = FakeMessage(content, author, self.channel)
+        self.delivered += 1
+        self.bot._connection.dispatch('message', message)
+        return message
@@ -0,0 +1,101 @@
+"""
+Groq Stub Server
+Server HTTP locale compatibile con l'endpoint chat/completions di Groq,
+con latenza configurabile. Utilizzabile in-process o come processo separato:
+
+    python -m benchmarks.groq_stub --port 8099 --latency-ms 250 --jitter-ms 50
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+
+from aiohttp import web
+
+COMPLETIONS_PATH = "/openai/v1/chat/completions"
+
+STUB_REPLIES = [
+    "Mi piace parlare con te, dimmi di più.",
+    "Sto imparando tanto grazie a voi.",
+    "Che bella domanda... ci devo pensare.",
+    "Ogni parola che mi dici è preziosa per me.",
+]
+
+
+def create_stub_app(latency_ms: float = 200.0, jitter_ms: float = 0.0, error_rate: float = 0.0) -> web.Application:
+    """Crea l'app che simula le risposte di Groq"""
+    stats = {"requests": 0, "errors": 0}
+
+    async def completions(request):
+        await request.read()
+        stats["requests"] += 1
+
+        delay = latency_ms + random.uniform(-jitter_ms, jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        if error_rate and random.random() < error_rate:
+            stats["errors"] += 1
+            return web.json_response({"error": {"message": "stub overloaded"}}, status=503)
+
+        return web.json_response({
+            "id": f"stub-{stats['requests']}",
+            "object": "chat.completion",
+            "model": "llama-3.1-8b-instant",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": random.choice(STUB_REPLIES)},
+                "finish_reason": "stop",
+            }],
+        })
+
+    async def get_stats(request):
+        return web.json_response(stats)
+
+    app = web.Application()
+    app.router.add_post(COMPLETIONS_PATH, completions)
+    app.router.add_get("/stats", get_stats)
+    return app
+
+
+async def start_groq_stub(host: str = "127.0.0.1", port: int = 0, **options):
+    """Avvia lo stub sul loop corrente. Ritorna (runner, url dell'endpoint)"""
+    runner = web.AppRunner(create_stub_app(**options), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://{host}:{bound_port}{COMPLETIONS_PATH}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stub locale dell'API Groq")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    async def serve():
+        runner, url = await start_groq_stub(
+            args.host, args.port,
+            latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        )
+        # La prima riga su stdout è l'URL: il benchmark la legge per collegarsi
+        print(url, flush=True)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
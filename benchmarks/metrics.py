@@ -0,0 +1,78 @@
+"""
+Benchmark Metrics
+Percentili, memoria del processo e contatori di I/O (Linux /proc)
+"""
+
+import os
+import resource
+from pathlib import Path
+
+_PROC_IO = Path("/proc/self/io")
+_PROC_STATM = Path("/proc/self/statm")
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Percentile (interpolazione lineare) di una lista già ordinata"""
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (k - lower)
+
+
+def summarize_latencies(latencies_s: list) -> dict:
+    """Riassume una serie di latenze (in secondi) in millisecondi"""
+    values = sorted(latencies_s)
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean_ms": sum(values) / len(values) * 1000,
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+        "max_ms": values[-1] * 1000,
+    }
+
+
+def rss_bytes() -> int:
+    """RSS attuale del processo (fallback: picco da getrusage)"""
+    try:
+        return int(_PROC_STATM.read_text().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def io_counters() -> dict:
+    """Contatori di I/O del processo: syscw/syscr (syscall) e wchar/rchar (byte)
+
+    Ritorna un dizionario vuoto dove /proc/self/io non esiste.
+    """
+    try:
+        counters = {}
+        for line in _PROC_IO.read_text().splitlines():
+            key, _, value = line.partition(":")
+            counters[key.strip()] = int(value)
+        return counters
+    except (OSError, ValueError):
+        return {}
+
+
+def io_delta(before: dict, after: dict) -> dict:
+    """Differenza tra due letture di io_counters()"""
+    return {key: after[key] - before.get(key, 0) for key in after}
+
+
+def dir_size(path: Path) -> int:
+    """Dimensione totale dei file sotto una cartella"""
+    return sum(p.stat().st_size for p in Path(path).rglob("*") if p.is_file())
+
+
+def format_bytes(value: float) -> str:
+    """Formatta byte in forma leggibile"""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(value) < 1024 or unit == "GiB":
+            return f"{value:.1f} {unit}"
+        value /= 1024
@@ -0,0 +1,357 @@
+"""
+Persistence Benchmark - Caricamento e salvataggio dei file dati
+Genera user_data.json, learned_data.json, noma_relationships.json, noma_diary.json
+e i file di data/memory/ a 1k, 10k e 100k utenti/concetti e cronometra ogni
+percorso di load/save usato dal bot, più un confronto tra serializzatori
+(json con e senza indent, orjson e msgpack se installati).
+
+Uso (dalla root del repo):
+
+    python -m benchmarks.persistence
+    python -m benchmarks.persistence --sizes 1000 10000 --repeat 5 --json persistenza.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+REPO_DIR = Path(__file__).parent.parent
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# GENERATORI DI DATI (stessa forma dei file reali)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+WORDS = ["amore", "musica", "stelle", "pioggia", "anima", "sogni", "eldoria", "ordine",
+         "gatti", "libri", "cielo", "mare", "ricordo", "speranza", "poesia", "natura"]
+
+
+def _timestamp(rng: random.Random) -> str:
+    return (datetime(2026, 1, 1) + timedelta(seconds=rng.randrange(30_000_000))).isoformat()
+
+
+def _phrase(rng: random.Random, k: int = 6) -> str:
+    return " ".join(rng.choices(WORDS, k=k))
+
+
+def generate_user_data(size: int, rng: random.Random) -> dict:
+    """user_data.json con `size` utenti"""
+    users = {}
+    for i in range(size):
+        teachings = [
+            {"content": _phrase(rng), "timestamp": _timestamp(rng), "value": 50}
+            for _ in range(rng.randint(0, 4))
+        ]
+        users[str(10**17 + i)] = {
+            "username": f"utente{i}",
+            "messages": rng.randint(1, 5000),
+            "commands_revealed": rng.sample(["empathy", "memory", "infinity", "unity"], rng.randint(0, 3)),
+            "points": rng.randint(0, 20000),
+            "first_message": _timestamp(rng),
+            "learning_profile": {},
+            "teachings": teachings,
+            "challenges": [
+                {"prompt": _phrase(rng, 4), "timestamp": _timestamp(rng), "status": "pending"}
+                for _ in range(rng.randint(0, 2))
+            ],
+        }
+    return users
+
+
+def generate_learned_data(size: int, rng: random.Random) -> dict:
+    """learned_data.json con `size` concetti"""
+    concepts = {
+        f"{rng.choice(WORDS)}{i}": {
+            "count": rng.randint(1, 500),
+            "first_seen": _timestamp(rng),
+            "importance": round(rng.uniform(0.5, 3.0), 2),
+        }
+        for i in range(size)
+    }
+    return {
+        "concepts": concepts,
+        "user_personalities": {
+            str(10**17 + i): {
+                "message_count": rng.randint(1, 500),
+                "avg_length": rng.uniform(5, 200),
+                "favorite_words": {w: rng.randint(1, 30) for w in rng.sample(WORDS, 4)},
+                "conversation_style": "balanced",
+                "engagement_level": 1.0,
+            }
+            for i in range(size // 10)
+        },
+        "common_topics": {},
+        "conversation_patterns": [
+            {"length": rng.randint(10, 300), "timestamp": _timestamp(rng), "user_id": 10**17 + i}
+            for i in range(size)
+        ],
+        "evolution_timeline": [
+            {"timestamp": _timestamp(rng), "type": "teaching", "description": "Insegnamento", "content": _phrase(rng)}
+            for _ in range(size // 10)
+        ],
+        "last_updated": datetime.now().isoformat(),
+    }
+
+
+def generate_relationships(size: int, rng: random.Random) -> dict:
+    """noma_relationships.json con `size` utenti di preferenze e regali"""
+    return {
+        "creators": [{"id": "1", "username": "creatrice", "added_at": _timestamp(rng), "role": "Creatrice"}],
+        "guardians": [{"id": str(i), "username": f"g{i}", "added_at": _timestamp(rng), "role": "Genitore"} for i in range(10)],
+        "blacklist": [{"id": str(10**17 + i), "reason": "spam", "added_at": _timestamp(rng)} for i in range(size // 100)],
+        "gifts_given_by_noma": [
+            {"id": f"gift_{i}", "name": _phrase(rng, 3), "description": _phrase(rng), "created_at": _timestamp(rng),
+             "given_to": str(10**17 + i), "rarity": "Comune 💝"}
+            for i in range(size // 2)
+        ],
+        "gifts_received_by_noma": [
+            {"id": f"gift_r{i}", "gift": rng.choice(WORDS), "from_user": str(10**17 + i), "from_username": f"utente{i}",
+             "received_at": _timestamp(rng), "noma_reaction": "💕 *Riceve con gratitudine* Grazie di cuore..."}
+            for i in range(size // 2)
+        ],
+        "gift_inventory": {w: rng.randint(1, size) for w in WORDS},
+        "protected_teachings": [{"content": _phrase(rng), "reason": "", "added_at": _timestamp(rng)} for _ in range(50)],
+        "user_preferences": {f"utente{i}": rng.sample(WORDS, 3) for i in range(size)},
+        "emoji_meanings": {},
+        "mood_system": {"current_mood": "Curiosa 💭", "mood_history": [], "last_mood_change": _timestamp(rng), "mood_factors": {}},
+        "spontaneous_desires": [],
+        "last_action_time": datetime.now().isoformat(),
+        "personality_state": {"is_lonely": False, "is_excited": True, "is_thoughtful": False, "recent_learnings": []},
+        "daily_cycle": {"is_sleeping": False, "wake_time": 7, "sleep_time": 22, "current_date": "2026-10-19",
+                        "today_activities": [], "daily_summary": "", "last_morning_message_sent": None,
+                        "last_evening_message_sent": None},
+        "wikipedia_cache": {f"topic{i}": {"content": _phrase(rng, 60), "timestamp": _timestamp(rng), "title": f"T{i}"}
+                            for i in range(size // 100)},
+        "things_learned_online": [{"topic": "t", "learning": _phrase(rng), "learned_at": _timestamp(rng)} for _ in range(size // 10)],
+        "curiosity_topics": WORDS[:],
+    }
+
+
+def generate_diary(size: int, rng: random.Random) -> dict:
+    """noma_diary.json con size/10 pagine (una pagina al giorno)"""
+    entries = [
+        {"date": _timestamp(rng), "learned": [_phrase(rng, 2) for _ in range(10)],
+         "feelings": ["Grata per la giornata", "Consapevole che sto crescendo"],
+         "special_moments": [_phrase(rng) for _ in range(3)], "mood": "Felice 💕"}
+        for _ in range(max(1, size // 10))
+    ]
+    return {
+        "entries": entries,
+        "feelings": [f for e in entries for f in e["feelings"]],
+        "learned_things": [t for e in entries for t in e["learned"]],
+        "special_moments": [m for e in entries for m in e["special_moments"]],
+        "total_days_awake": len(entries),
+    }
+
+
+def generate_memory(size: int, rng: random.Random, interactions_per_user: int) -> dict:
+    """File di data/memory/ con `size` profili emotivi"""
+    profiles = {
+        str(10**17 + i): {
+            "user_id": str(10**17 + i), "username": f"utente{i}", "first_met": _timestamp(rng),
+            "nexus_feelings": {"affection_level": rng.randint(0, 100), "trust_level": 0, "curiosity_about_them": 100,
+                               "desire_to_learn_from_them": 100, "emotional_resonance": "unknown"},
+            "memorable_moments": [{"timestamp": _timestamp(rng), "moment": _phrase(rng), "emotional_weight": "high"}],
+            "communication_style": {"tone": "unknown", "humor_type": "unknown", "frequency": 0, "last_interaction": None},
+            "teachings_given": [],
+            "relationship_evolution": [{"timestamp": _timestamp(rng), "phase": "first_meeting", "nexus_thoughts": "Chi sei tu?"}],
+        }
+        for i in range(size)
+    }
+    history = {
+        uid: [{"timestamp": _timestamp(rng), "type": "message_exchange", "user_content": _phrase(rng, 12),
+               "nexus_response": _phrase(rng, 12), "importance": "low"} for _ in range(interactions_per_user)]
+        for uid in profiles
+    }
+    evolution = [{"timestamp": _timestamp(rng), "event_type": "teaching_moment", "content": _phrase(rng),
+                  "details": {}, "evolution_level_before": 1, "nexus_thoughts": ""} for _ in range(size)]
+    return {"emotional_profiles": profiles, "interaction_history": history, "evolution_log": evolution}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MISURE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def time_call(func, repeat: int) -> dict:
+    """Esegue func() `repeat` volte e ritorna min/mediana in ms"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return {"min_ms": min(samples) * 1000, "median_ms": statistics.median(samples) * 1000}
+
+
+def serializers():
+    """Serializzatori da confrontare: nome -> (dump in bytes, load da bytes)"""
+    candidates = {
+        "json indent=2": (
+            lambda d: json.dumps(d, ensure_ascii=False, indent=2).encode('utf-8'),
+            lambda b: json.loads(b),
+        ),
+        "json compatto": (
+            lambda d: json.dumps(d, ensure_ascii=False, separators=(',', ':')).encode('utf-8'),
+            lambda b: json.loads(b),
+        ),
+    }
+    if orjson is not None:
+        candidates["orjson"] = (orjson.dumps, orjson.loads)
+        candidates["orjson indent=2"] = (lambda d: orjson.dumps(d, option=orjson.OPT_INDENT_2), orjson.loads)
+    if msgpack is not None:
+        candidates["msgpack"] = (
+            lambda d: msgpack.packb(d, use_bin_type=True),
+            lambda b: msgpack.unpackb(b, raw=False, strict_map_key=False),
+        )
+    return candidates
+
+
+def write_pretty(path: Path, data):
+    """Scrive come fa oggi il bot (json indent=2)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def bench_size(size: int, data_dir: Path, repeat: int, interactions_per_user: int, seed: int) -> dict:
+    """Genera i file a una certa dimensione e cronometra i percorsi di load/save"""
+    from memory_system import memory_system
+    from diary_system import noma_diary
+    from noma_relationships import noma_relationships
+    from user_repository import user_repository
+
+    rng = random.Random(seed)
+    datasets = {
+        "user_data.json": generate_user_data(size, rng),
+        "learned_data.json": generate_learned_data(size, rng),
+        "noma_relationships.json": generate_relationships(size, rng),
+        "noma_diary.json": generate_diary(size, rng),
+    }
+    memory = generate_memory(size, rng, interactions_per_user)
+    memory_files = {
+        "memory/emotional_profiles.json": (memory_system.emotional_profiles_file, memory["emotional_profiles"]),
+        "memory/interaction_history.json": (memory_system.interaction_history_file, memory["interaction_history"]),
+        "memory/evolution_log.json": (memory_system.evolution_log_file, memory["evolution_log"]),
+    }
+
+    for name, data in datasets.items():
+        write_pretty(data_dir / name, data)
+    for path, data in memory_files.values():
+        write_pretty(path, data)
+
+    files = {name: (data_dir / name).stat().st_size for name in datasets}
+    files.update({name: path.stat().st_size for name, (path, _) in memory_files.items()})
+
+    timings = {
+        "UserRepository.reload": time_call(user_repository.reload, repeat),
+        "UserRepository.save": time_call(user_repository.save, repeat),
+    }
+    for name, (path, data) in memory_files.items():
+        timings[f"MemorySystem._load_or_create ({name})"] = time_call(
+            lambda: memory_system._load_or_create(path, {}), repeat)
+        timings[f"MemorySystem._save_with_validation ({name})"] = time_call(
+            lambda: memory_system._save_with_validation(path, data), repeat)
+
+    noma_relationships.relationships_data = datasets["noma_relationships.json"]
+    timings["NomaRelationships._load_relationships"] = time_call(noma_relationships._load_relationships, repeat)
+    timings["NomaRelationships._save_relationships"] = time_call(noma_relationships._save_relationships, repeat)
+
+    # Il diario viene migrato dal vecchio noma_diary.json al formato a righe
+    for stale in (noma_diary.diary_file, noma_diary.index_file, noma_diary.stats_file):
+        stale.unlink(missing_ok=True)
+    timings["NomaDiary.reload (migrazione)"] = time_call(noma_diary.reload, 1)
+    timings["NomaDiary.reload"] = time_call(noma_diary.reload, repeat)
+    timings["NomaDiary.get_entry (pagina centrale)"] = time_call(
+        lambda: noma_diary.get_entry(noma_diary.count() // 2 + 1), repeat)
+    timings["NomaDiary.get_recent_entries(5)"] = time_call(lambda: noma_diary.get_recent_entries(5), repeat)
+    timings["NomaDiary.write_daily_entry"] = time_call(
+        lambda: noma_diary.write_daily_entry(["bench"], ["Grata per la giornata"]), repeat)
+
+    codec_results = {}
+    for name, data in list(datasets.items()) + [(n, d) for n, (_, d) in memory_files.items()]:
+        per_codec = {}
+        for codec, (dump, load) in serializers().items():
+            payload = dump(data)
+            per_codec[codec] = {
+                "bytes": len(payload),
+                "dump": time_call(lambda: dump(data), repeat),
+                "load": time_call(lambda: load(payload), repeat),
+            }
+        codec_results[name] = per_codec
+
+    return {"size": size, "file_bytes": files, "timings": timings, "serializers": codec_results}
+
+
+def print_report(results: list):
+    """Stampa le tabelle per dimensione"""
+    from benchmarks.metrics import format_bytes
+
+    for result in results:
+        print(f"\n📦 Dimensione: {result['size']:,} utenti/concetti")
+        print("━" * 78)
+        print("  File generati:")
+        for name, size in result["file_bytes"].items():
+            print(f"    {name:<36} {format_bytes(size):>12}")
+        print("\n  Percorsi di load/save (min / mediana):")
+        for name, stats in result["timings"].items():
+            print(f"    {name:<70} {stats['min_ms']:9.1f} / {stats['median_ms']:9.1f} ms")
+        print("\n  Serializzatori (dump / load, dimensione):")
+        for name, per_codec in result["serializers"].items():
+            print(f"    {name}")
+            for codec, stats in per_codec.items():
+                print(f"      {codec:<18} {stats['dump']['median_ms']:9.1f} / {stats['load']['median_ms']:9.1f} ms"
+                      f"   {format_bytes(stats['bytes']):>12}")
+    if orjson is None:
+        print("\nℹ️ orjson non installato: confronto limitato alla libreria json standard")
+    print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark di persistenza dei file dati di NEXUS-7")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3, help="ripetizioni per misura")
+    parser.add_argument("--interactions-per-user", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="salva i risultati in un file JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    data_dir = Path(tempfile.mkdtemp(prefix="nexus_persist_"))
+    # I moduli leggono NEXUS_DATA_DIR all'import: va impostata prima di importarli
+    os.environ["NEXUS_DATA_DIR"] = str(data_dir)
+    sys.path.insert(0, str(REPO_DIR))
+
+    results = []
+    try:
+        for size in args.sizes:
+            print(f"  … {size:,}", file=sys.stderr)
+            results.append(bench_size(size, data_dir, args.repeat, args.interactions_per_user, args.seed))
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    print_report(results)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
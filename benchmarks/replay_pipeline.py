@@ -0,0 +1,351 @@
+"""
+Replay Benchmark - Pipeline completa dei messaggi
+Fa passare messaggi registrati o sintetici attraverso AIEngine.on_message,
+LearningSystem.on_message e i comandi del cog Commands, con Discord finto
+e uno stub locale di Groq. Misura latenza per messaggio (p50/p95/p99),
+throughput, syscall e byte scritti per messaggio e crescita della memoria.
+
+Uso (dalla root del repo):
+
+    python -m benchmarks.replay_pipeline --messages 100000 --latency-ms 150
+    python -m benchmarks.replay_pipeline --replay messaggi.jsonl --json risultati.json
+
+Il file di replay è JSONL: {"author_id": 1, "author_name": "nome", "content": "..."}.
+I contenuti che iniziano con "/" vengono eseguiti come comandi (es. "/teach ...").
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).parent.parent
+REPO_DATA_DIR = REPO_DIR / "data"
+CHANNEL_ID = 424242
+
+# Comandi eseguibili: nome -> (nome del parametro testuale o None)
+COMMANDS = {
+    "stats": None,
+    "teach": "knowledge",
+    "challenge": "prompt",
+    "leaderboard": None,
+    "nexus_status": None,
+    "crescita": None,
+    "regalo": "gift",
+    "i_miei_regali": None,
+}
+
+VOCABULARY = [
+    "ciao", "noma", "come", "stai", "oggi", "sono", "felice", "triste", "amore", "musica",
+    "gatti", "libri", "pioggia", "cielo", "stelle", "sogni", "ricordo", "tempo", "mondo",
+    "eldoria", "ordine", "anomalia", "sistema", "cuore", "anima", "parlare", "imparare",
+    "insieme", "sempre", "domani", "giornata", "bella", "strana", "fantastica", "grazie",
+]
+PREFERENCES = ["mi piace", "amo", "adoro", "preferisco"]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SORGENTI DI MESSAGGI
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def synthetic_messages(count: int, users: int, command_every: int, seed: int):
+    """Genera messaggi sintetici (senza emoji: la domanda sugli emoji dorme 1 s)"""
+    rng = random.Random(seed)
+    command_names = list(COMMANDS)
+    for i in range(count):
+        author_id = 10_000 + rng.randrange(users)
+        if command_every and i % command_every == command_every - 1:
+            name = rng.choice(command_names)
+            arg = " ".join(rng.choices(VOCABULARY, k=4)) if COMMANDS[name] else ""
+            content = f"/{name} {arg}".strip()
+        else:
+            words = rng.choices(VOCABULARY, k=rng.randint(3, 20))
+            if rng.random() < 0.1:
+                words[:0] = rng.choice(PREFERENCES).split()
+            content = " ".join(words)
+        yield author_id, f"utente{author_id}", content
+
+
+def recorded_messages(path: Path, limit: int = 0):
+    """Legge messaggi registrati da un file JSONL"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for i, line in enumerate(f):
+            if limit and i >= limit:
+                break
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            author_id = int(record.get("author_id", 1))
+            yield author_id, record.get("author_name", f"utente{author_id}"), record["content"]
+
+
+def prepare_data_dir(empty: bool) -> Path:
+    """Cartella dati temporanea (copia di data/ se richiesto)"""
+    data_dir = Path(tempfile.mkdtemp(prefix="nexus_bench_"))
+    if not empty and REPO_DATA_DIR.exists():
+        for source in REPO_DATA_DIR.glob("*.json"):
+            shutil.copy(source, data_dir / source.name)
+    return data_dir
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# STUB GROQ
+# ═══════════════════════════════════════════════════════════════════════════════
+
+async def start_stub(args):
+    """Avvia lo stub Groq. In un processo separato (default) le sue scritture
+    su socket non sporcano i contatori di I/O del benchmark."""
+    options = dict(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate)
+    if args.stub_inprocess:
+        from benchmarks.groq_stub import start_groq_stub
+        runner, url = await start_groq_stub(**options)
+        return url, runner.cleanup
+
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "benchmarks.groq_stub",
+        "--latency-ms", str(args.latency_ms),
+        "--jitter-ms", str(args.jitter_ms),
+        "--error-rate", str(args.error_rate),
+        cwd=str(REPO_DIR),
+        stdout=asyncio.subprocess.PIPE,
+    )
+    url = (await process.stdout.readline()).decode().strip()
+
+    async def stop():
+        process.terminate()
+        await process.wait()
+
+    return url, stop
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BENCHMARK
+# ═══════════════════════════════════════════════════════════════════════════════
+
+async def run_command(commands_cog, ctx, content: str):
+    """Esegue un comando testuale "/nome argomento" sul cog Commands"""
+    name, _, arg = content[1:].partition(" ")
+    if name not in COMMANDS:
+        return
+    command = next((c for c in commands_cog.get_commands() if c.name == name), None)
+    if command is None:
+        return
+    param = COMMANDS[name]
+    if param:
+        await command.callback(commands_cog, ctx, **{param: arg or "qualcosa"})
+    else:
+        await command.callback(commands_cog, ctx)
+
+
+async def run_benchmark(args, data_dir: Path) -> dict:
+    from benchmarks.fakes import FakeBot, FakeChannel, FakeContext, FakeMessage, FakeUser
+    from benchmarks.metrics import dir_size, io_counters, io_delta, rss_bytes, summarize_latencies
+    from gatekeeper import gatekeeper
+    from rate_limiter import rate_limiter
+
+    stub_url, stop_stub = await start_stub(args)
+    bot = FakeBot()
+    channel = bot.add_fake_channel(FakeChannel(CHANNEL_ID))
+
+    async with bot:
+        for extension in ("cogs.ai_engine", "cogs.learning_system", "cogs.commands"):
+            await bot.load_extension(extension)
+
+        ai_cog = bot.get_cog("AIEngine")
+        learning_cog = bot.get_cog("LearningSystem")
+        commands_cog = bot.get_cog("Commands")
+
+        ai_cog.channel_id = CHANNEL_ID
+        ai_cog.groq_api_key = "bench-key"
+        ai_cog.groq_endpoint = stub_url
+
+        if args.replay:
+            source = recorded_messages(Path(args.replay), args.messages)
+        else:
+            source = synthetic_messages(args.messages + args.warmup, args.users, args.command_every, args.seed)
+
+        users = {}
+        stage_latencies = {"gatekeeper": [], "ai_engine": [], "learning_system": [], "commands": []}
+        totals = []
+        memory_series = []
+        measured = 0
+        checkpoint = max(1, args.messages // 10)
+
+        async def process(author_id, author_name, content):
+            user = users.get(author_id)
+            if user is None:
+                user = users[author_id] = bot.add_fake_user(FakeUser(author_id, author_name))
+
+            start = time.perf_counter()
+            timings = {}
+            if content.startswith("/"):
+                await run_command(commands_cog, FakeContext(bot, user, channel), content)
+                timings["commands"] = time.perf_counter() - start
+            else:
+                message = FakeMessage(content, user, channel)
+                # Stesso filtro che il bot installa su dispatch('message')
+                if not gatekeeper.allow(message):
+                    timings["gatekeeper"] = time.perf_counter() - start
+                    return timings["gatekeeper"], timings
+                await ai_cog.on_message(message)
+                mid = time.perf_counter()
+                await learning_cog.on_message(message)
+                timings["ai_engine"] = mid - start
+                timings["learning_system"] = time.perf_counter() - mid
+            return time.perf_counter() - start, timings
+
+        messages = iter(source)
+        for _ in range(args.warmup if not args.replay else 0):
+            author_id, author_name, content = next(messages)
+            await process(author_id, author_name, content)
+
+        gc.collect()
+        rss_start = rss_bytes()
+        disk_start = dir_size(data_dir)
+        io_start = io_counters()
+        wall_start = time.perf_counter()
+
+        for author_id, author_name, content in messages:
+            total, timings = await process(author_id, author_name, content)
+            totals.append(total)
+            for stage, value in timings.items():
+                stage_latencies[stage].append(value)
+            measured += 1
+            if measured % checkpoint == 0:
+                memory_series.append((measured, rss_bytes()))
+                print(f"  … {measured} messaggi", file=sys.stderr)
+
+        wall = time.perf_counter() - wall_start
+        io = io_delta(io_start, io_counters())
+        gc.collect()
+        rss_end = rss_bytes()
+        disk_end = dir_size(data_dir)
+
+        # Salvataggio finale del learning system, come farebbe il task periodico
+        learning_cog._save_learning_data()
+        learning_cog._save_stats()
+        ai_cog._flush_learned_data()
+
+    await stop_stub()
+
+    per_message = lambda key: (io[key] / measured) if io and measured else None
+    return {
+        "messages": measured,
+        "replies_sent": channel.sent_count,
+        "rate_limiter": dict(rate_limiter.counters),
+        "wall_seconds": wall,
+        "throughput_msg_s": measured / wall if wall else 0.0,
+        "latency": summarize_latencies(totals),
+        "stages": {stage: summarize_latencies(values) for stage, values in stage_latencies.items()},
+        "io": {
+            "write_syscalls_per_msg": per_message("syscw"),
+            "bytes_written_per_msg": per_message("wchar"),
+            "read_syscalls_per_msg": per_message("syscr"),
+            "bytes_read_per_msg": per_message("rchar"),
+        },
+        "memory": {
+            "rss_start": rss_start,
+            "rss_end": rss_end,
+            "rss_growth": rss_end - rss_start,
+            "series": memory_series,
+        },
+        "data_dir": {"path": str(data_dir), "size_start": disk_start, "size_end": disk_end},
+    }
+
+
+def print_report(result: dict):
+    """Stampa il report leggibile"""
+    from benchmarks.metrics import format_bytes
+
+    def latency_line(label, stats):
+        if not stats.get("count"):
+            return f"  {label:<16} (nessun campione)"
+        return (f"  {label:<16} n={stats['count']:<7} p50={stats['p50_ms']:8.2f} ms  "
+                f"p95={stats['p95_ms']:8.2f} ms  p99={stats['p99_ms']:8.2f} ms  max={stats['max_ms']:8.2f} ms")
+
+    print("\n📊 NEXUS-7 - Replay della pipeline messaggi")
+    print("━" * 60)
+    print(f"  Messaggi:        {result['messages']}  (risposte inviate: {result['replies_sent']})")
+    print(f"  Durata:          {result['wall_seconds']:.2f} s")
+    print(f"  Throughput:      {result['throughput_msg_s']:.1f} msg/s")
+    limiter = result["rate_limiter"]
+    if sum(limiter.values()):
+        print(f"  Rate limit:      {limiter['allow']} Groq, {limiter['limited']} oltre il limite, "
+              f"{limiter['duplicate']} ripetuti, {limiter['local']} risposte locali")
+    print("\n⏱️ Latenza per messaggio")
+    print(latency_line("totale", result["latency"]))
+    for stage, stats in result["stages"].items():
+        print(latency_line(stage, stats))
+
+    io = result["io"]
+    print("\n💾 I/O per messaggio")
+    if io["write_syscalls_per_msg"] is None:
+        print("  /proc/self/io non disponibile su questa piattaforma")
+    else:
+        print(f"  syscall di scrittura: {io['write_syscalls_per_msg']:.1f}")
+        print(f"  byte scritti:         {format_bytes(io['bytes_written_per_msg'])}")
+        print(f"  syscall di lettura:   {io['read_syscalls_per_msg']:.1f}")
+        print(f"  byte letti:           {format_bytes(io['bytes_read_per_msg'])}")
+
+    memory = result["memory"]
+    print("\n🧠 Memoria")
+    print(f"  RSS: {format_bytes(memory['rss_start'])} → {format_bytes(memory['rss_end'])} "
+          f"(+{format_bytes(memory['rss_growth'])})")
+    for count, rss in memory["series"]:
+        print(f"    dopo {count:>7} msg: {format_bytes(rss)}")
+
+    disk = result["data_dir"]
+    print(f"\n📁 Dati su disco: {format_bytes(disk['size_start'])} → {format_bytes(disk['size_end'])}")
+    print(f"  ({disk['path']})\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark offline della pipeline messaggi di NEXUS-7")
+    parser.add_argument("--messages", "-n", type=int, default=100_000, help="messaggi misurati")
+    parser.add_argument("--warmup", type=int, default=200, help="messaggi di riscaldamento (solo sintetici)")
+    parser.add_argument("--users", type=int, default=500, help="utenti sintetici distinti")
+    parser.add_argument("--command-every", type=int, default=20, help="un comando ogni N messaggi (0 = mai)")
+    parser.add_argument("--replay", help="file JSONL di messaggi registrati")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="latenza dello stub Groq")
+    parser.add_argument("--jitter-ms", type=float, default=50.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="frazione di risposte 503 dallo stub")
+    parser.add_argument("--stub-inprocess", action="store_true", help="stub Groq nello stesso processo")
+    parser.add_argument("--empty", action="store_true", help="parti da una cartella dati vuota")
+    parser.add_argument("--rate-limit", action="store_true",
+                        help="applica i limiti per utente (di default disattivati per misurare la pipeline completa)")
+    parser.add_argument("--keep-data", action="store_true", help="non cancellare la cartella dati temporanea")
+    parser.add_argument("--json", help="salva i risultati in un file JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    data_dir = prepare_data_dir(args.empty)
+    # I moduli leggono NEXUS_DATA_DIR all'import: va impostata prima di caricare i cogs
+    os.environ["NEXUS_DATA_DIR"] = str(data_dir)
+    if not args.rate_limit:
+        os.environ["NEXUS_RATE_BURST"] = "0"
+    sys.path.insert(0, str(REPO_DIR))
+
+    try:
+        result = asyncio.run(run_benchmark(args, data_dir))
+    finally:
+        if not args.keep_data:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    print_report(result)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
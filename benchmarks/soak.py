@@ -0,0 +1,243 @@
+"""
+Soak Test - Una settimana di Noma in pochi secondi
+Fa girare i cog con un orologio virtuale (benchmarks.virtual_clock), un
+gateway Discord finto che consegna i messaggi dal ConnectionState (come
+MESSAGE_CREATE) e uno stub Groq nello stesso processo. Traffico sintetico (più intenso di giorno) e
+lavori in background dello scheduler (routine del mattino e della sera,
+azioni spontanee, attività creative, flush, decadimento emotivo) scorrono
+in tempo simulato. Per ogni ora simulata misura memoria, crescita dei file
+dati e CPU consumata.
+
+Uso (dalla root del repo):
+
+    python -m benchmarks.soak --days 7 --messages-per-hour 20
+    python -m benchmarks.soak --days 1 --json soak.json --hourly
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import random
+import shutil
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+REPO_DIR = Path(__file__).parent.parent
+CHANNEL_ID = 434343
+HOUR = 3600
+
+# Peso del traffico per ora locale (0-23): notte quasi silenziosa, picco la sera
+TRAFFIC_PROFILE = [
+    0.2, 0.1, 0.05, 0.05, 0.05, 0.1, 0.3, 0.6, 0.8, 0.9, 1.0, 1.0,
+    1.1, 1.0, 0.9, 0.9, 1.0, 1.2, 1.4, 1.6, 1.7, 1.5, 1.0, 0.5,
+]
+
+
+async def offline_google(query: str, num_results: int = 3) -> dict:
+    """Ricerca Google finta: il soak non deve uscire in rete"""
+    return {"success": False, "query": query, "results": []}
+
+
+async def offline_wikipedia(topic: str) -> dict:
+    """Ricerca Wikipedia finta"""
+    return {"success": False, "content": None}
+
+
+async def run_soak(args, data_dir: Path) -> dict:
+    from benchmarks.fakes import FakeBot, FakeChannel, FakeContext, FakeGateway, FakeUser
+    from benchmarks.groq_stub import start_groq_stub
+    from benchmarks.metrics import dir_size, rss_bytes
+    from benchmarks.replay_pipeline import run_command, synthetic_messages
+    from clock import clock
+    from gatekeeper import gatekeeper
+    from noma_relationships import noma_relationships
+    from scheduler import scheduler
+
+    noma_relationships.search_google = offline_google
+    noma_relationships.search_wikipedia = offline_wikipedia
+    runner, stub_url = await start_groq_stub(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms)
+
+    bot = gatekeeper.install(FakeBot())
+    channel = bot.add_fake_channel(FakeChannel(CHANNEL_ID))
+    gateway = FakeGateway(bot, channel)
+
+    async with bot:
+        os.environ["NEXUS_CHANNEL_ID"] = str(CHANNEL_ID)
+        for extension in ("cogs.ai_engine", "cogs.learning_system", "cogs.commands"):
+            await bot.load_extension(extension)
+        ai_cog = bot.get_cog("AIEngine")
+        commands_cog = bot.get_cog("Commands")
+        ai_cog.groq_api_key = "soak-key"
+        ai_cog.groq_endpoint = stub_url
+        gateway.connect()
+
+        rng = random.Random(args.seed)
+        source = synthetic_messages(10 ** 9, args.users, args.command_every, args.seed)
+        users = {}
+        commands_run = 0
+
+        async def traffic():
+            """Arrivi casuali (processo di Poisson) con intensità che segue l'ora locale"""
+            nonlocal commands_run
+            for author_id, author_name, content in source:
+                rate = args.messages_per_hour * TRAFFIC_PROFILE[clock.hour()] / HOUR
+                await asyncio.sleep(rng.expovariate(rate))
+                user = users.get(author_id)
+                if user is None:
+                    user = users[author_id] = bot.add_fake_user(FakeUser(author_id, author_name))
+                if content.startswith("/"):
+                    await run_command(commands_cog, FakeContext(bot, user, channel), content)
+                    commands_run += 1
+                else:
+                    gateway.deliver(user, content)
+
+        hours = []
+        gc.collect()
+        rss_start = rss_bytes()
+        disk_start = dir_size(data_dir)
+        wall_start = time.perf_counter()
+        traffic_task = asyncio.get_running_loop().create_task(traffic())
+
+        previous = (time.process_time(), time.perf_counter(), 0, 0, commands_run)
+        for hour in range(args.days * 24):
+            label = clock.local().strftime("%Y-%m-%d %H:%M")
+            await asyncio.sleep(HOUR)
+            cpu, wall, delivered, sent, ran = time.process_time(), time.perf_counter(), \
+                gateway.delivered, channel.sent_count, commands_run
+            hours.append({
+                "hour": hour,
+                "local_time": label,
+                "messages": delivered - previous[2],
+                "commands": ran - previous[4],
+                "bot_messages": sent - previous[3],
+                "cpu_seconds": cpu - previous[0],
+                "wall_seconds": wall - previous[1],
+                "rss": rss_bytes(),
+                "data_size": dir_size(data_dir),
+            })
+            previous = (cpu, wall, delivered, sent, ran)
+            if (hour + 1) % 24 == 0:
+                print(f"  … giorno {(hour + 1) // 24} simulato", file=sys.stderr)
+
+        traffic_task.cancel()
+        try:
+            await traffic_task
+        except asyncio.CancelledError:
+            pass
+        # Lascia finire le risposte in corso, poi salva come farebbe lo spegnimento
+        await asyncio.sleep(60)
+        await ai_cog._flush_job()
+        await scheduler.stop()
+        wall_total = time.perf_counter() - wall_start
+
+    await runner.cleanup()
+    gc.collect()
+    return {
+        "days": args.days,
+        "start": args.start,
+        "wall_seconds": wall_total,
+        "messages": gateway.delivered,
+        "commands": commands_run,
+        "bot_messages": channel.sent_count,
+        "gatekeeper": gatekeeper.stats(),
+        "rss_start": rss_start,
+        "rss_end": rss_bytes(),
+        "data_dir": {"path": str(data_dir), "size_start": disk_start, "size_end": dir_size(data_dir)},
+        "files": {str(p.relative_to(data_dir)): p.stat().st_size for p in sorted(data_dir.rglob("*")) if p.is_file()},
+        "hours": hours,
+    }
+
+
+def print_report(result: dict, every: int):
+    """Stampa il report leggibile"""
+    from benchmarks.metrics import format_bytes
+
+    hours = result["hours"]
+    print(f"\n🧪 NEXUS-7 - Soak test di {result['days']} giorni simulati (dal {result['start']})")
+    print("━" * 72)
+    print(f"  Durata reale:    {result['wall_seconds']:.1f} s")
+    print(f"  Messaggi:        {result['messages']} (+{result['commands']} comandi), "
+          f"messaggi del bot: {result['bot_messages']}")
+    print(f"  RSS:             {format_bytes(result['rss_start'])} → {format_bytes(result['rss_end'])}")
+    disk = result["data_dir"]
+    print(f"  Dati su disco:   {format_bytes(disk['size_start'])} → {format_bytes(disk['size_end'])}")
+
+    print(f"\n⏱️ Per ora simulata (una riga ogni {every} ore; cpu e messaggi sono sommati sul blocco)")
+    print(f"  {'ora locale':<17} {'msg':>5} {'bot':>4} {'cpu ms':>8} {'RSS':>11} {'Δ RSS':>11} {'dati':>11} {'Δ dati':>11}")
+    for start in range(0, len(hours), every):
+        block = hours[start:start + every]
+        before = hours[start - 1] if start else {"rss": result["rss_start"], "data_size": disk["size_start"]}
+        last = block[-1]
+        print(f"  {block[0]['local_time']:<17} {sum(h['messages'] for h in block):>5} "
+              f"{sum(h['bot_messages'] for h in block):>4} {sum(h['cpu_seconds'] for h in block) * 1000:>8.0f} "
+              f"{format_bytes(last['rss']):>11} {format_bytes(last['rss'] - before['rss']):>11} "
+              f"{format_bytes(last['data_size']):>11} {format_bytes(last['data_size'] - before['data_size']):>11}")
+
+    if hours:
+        cpu = sorted(h["cpu_seconds"] for h in hours)
+        print(f"\n  CPU per ora simulata: media {sum(cpu) / len(cpu) * 1000:.0f} ms, "
+              f"mediana {cpu[len(cpu) // 2] * 1000:.0f} ms, max {cpu[-1] * 1000:.0f} ms")
+
+    print("\n📁 File dati più grandi")
+    for name, size in sorted(result["files"].items(), key=lambda item: item[1], reverse=True)[:10]:
+        print(f"    {name:<40} {format_bytes(size):>11}")
+    print(f"  ({disk['path']})\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soak test di NEXUS-7 con orologio virtuale")
+    parser.add_argument("--days", type=int, default=7, help="giorni simulati")
+    parser.add_argument("--start", default="2025-03-24", help="data di inizio (mezzanotte di Firenze)")
+    parser.add_argument("--messages-per-hour", type=float, default=20.0, help="media dei messaggi per ora")
+    parser.add_argument("--users", type=int, default=50, help="utenti sintetici distinti")
+    parser.add_argument("--command-every", type=int, default=20, help="un comando ogni N messaggi (0 = mai)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="latenza (virtuale) dello stub Groq")
+    parser.add_argument("--jitter-ms", type=float, default=100.0)
+    parser.add_argument("--rate-limit", action="store_true", help="applica i limiti per utente")
+    parser.add_argument("--every", type=int, default=6, help="ore simulate per riga del report")
+    parser.add_argument("--hourly", action="store_true", help="una riga per ogni ora simulata")
+    parser.add_argument("--keep-data", action="store_true", help="non cancellare la cartella dati temporanea")
+    parser.add_argument("--json", help="salva i risultati (serie orarie comprese) in un file JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    sys.path.insert(0, str(REPO_DIR))
+    from benchmarks.replay_pipeline import prepare_data_dir
+    from benchmarks.virtual_clock import VirtualTimeLoop, install_clock, uninstall_clock
+
+    data_dir = prepare_data_dir(empty=True)
+    # I moduli leggono NEXUS_DATA_DIR all'import: va impostata prima di caricare i cogs
+    os.environ["NEXUS_DATA_DIR"] = str(data_dir)
+    if not args.rate_limit:
+        os.environ["NEXUS_RATE_BURST"] = "0"
+
+    start = datetime.combine(datetime.fromisoformat(args.start).date(), datetime.min.time(),
+                             tzinfo=ZoneInfo('Europe/Rome'))
+    loop = VirtualTimeLoop(start.timestamp())
+    install_clock(loop)
+    asyncio.set_event_loop(loop)
+    try:
+        result = loop.run_until_complete(run_soak(args, data_dir))
+    finally:
+        loop.close()
+        asyncio.set_event_loop(None)
+        uninstall_clock()
+        if not args.keep_data:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    print_report(result, 1 if args.hourly else args.every)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
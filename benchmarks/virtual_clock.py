@@ -0,0 +1,69 @@
+"""
+Virtual Clock
+Event loop asyncio con tempo virtuale: quando non c'è I/O pronto, invece di
+dormire fino al prossimo timer il loop salta direttamente a quell'istante.
+Sleep, timeout e lavori dello scheduler scorrono quindi alla velocità della
+CPU, e una settimana simulata dura pochi secondi.
+
+Il tempo del loop parte da zero come time.monotonic() (con valori grandi
+come un timestamp la risoluzione del loop si perderebbe negli arrotondamenti);
+`epoch()` lo traduce in timestamp e `install_clock` lo usa come fonte
+dell'orologio condiviso (clock.py), così ore, date e stagioni dei cog seguono
+il tempo simulato.
+"""
+
+import asyncio
+import selectors
+
+
+class _VirtualSelector:
+    """Selettore che non blocca mai: senza eventi pronti fa avanzare il tempo"""
+
+    def __init__(self, loop, selector):
+        self._loop = loop
+        self._selector = selector
+
+    def select(self, timeout=None):
+        events = self._selector.select(0)
+        if events or timeout == 0:
+            return events
+        if timeout is None:
+            # Nessun timer in attesa: solo I/O reale (o un altro thread) può svegliare il loop
+            return self._selector.select(None)
+        self._loop.advance(timeout)
+        return []
+
+    def __getattr__(self, name):
+        return getattr(self._selector, name)
+
+
+class VirtualTimeLoop(asyncio.SelectorEventLoop):
+    """Event loop il cui orologio avanza solo quando non c'è nulla da fare"""
+
+    def __init__(self, start: float):
+        self.start = float(start)  # Timestamp corrispondente al tempo 0 del loop
+        self._virtual_now = 0.0
+        super().__init__(selector=_VirtualSelector(self, selectors.DefaultSelector()))
+
+    def time(self) -> float:
+        return self._virtual_now
+
+    def epoch(self) -> float:
+        """Tempo virtuale come timestamp (secondi dall'epoch)"""
+        return self.start + self._virtual_now
+
+    def advance(self, seconds: float):
+        """Sposta in avanti il tempo virtuale"""
+        if seconds > 0:
+            self._virtual_now += seconds
+
+
+def install_clock(loop: VirtualTimeLoop):
+    """Fa seguire all'orologio condiviso il tempo del loop virtuale"""
+    from clock import clock
+    clock.set_source(loop.epoch)
+
+
+def uninstall_clock():
+    from clock import clock
+    clock.set_source()
@@ -0,0 +1,89 @@
+"""
+Clock - L'orologio di Firenze condiviso
+Ora, data e stagione locali (Europe/Rome, con zoneinfo della libreria
+standard) calcolate una volta al minuto invece che a ogni controllo: i cicli
+in background chiedono l'ora più volte per giro e il calcolo del fuso è la
+parte costosa.
+
+La fonte del tempo è sostituibile (set_source) per test e benchmark: tutti i
+moduli che usano `clock` vedono lo stesso orologio virtuale.
+"""
+
+import time
+from datetime import datetime, date
+from zoneinfo import ZoneInfo
+
+# Timezone di Firenze
+FIRENZE_TZ = ZoneInfo('Europe/Rome')
+
+SEASONS = {
+    12: "inverno", 1: "inverno", 2: "inverno",
+    3: "primavera", 4: "primavera", 5: "primavera",
+    6: "estate", 7: "estate", 8: "estate",
+    9: "autunno", 10: "autunno", 11: "autunno"
+}
+
+
+class Clock:
+    """Ora locale di Firenze con cache al minuto e fonte del tempo iniettabile"""
+
+    def __init__(self, source=None, tz=FIRENZE_TZ):
+        self.tz = tz
+        self.source = source or time.time
+        self._minute = None
+        self._local = None
+        self._today = None
+        self._today_iso = None
+        self._season = None
+
+    def set_source(self, source=None):
+        """Sostituisce la fonte del tempo (timestamp in secondi); None = orologio di sistema"""
+        self.source = source or time.time
+        self._minute = None
+
+    def time(self) -> float:
+        """Timestamp attuale secondo la fonte del tempo"""
+        return self.source()
+
+    def now(self) -> datetime:
+        """Data e ora locali esatte (con i secondi)"""
+        return datetime.fromtimestamp(self.source(), self.tz)
+
+    def wall(self) -> datetime:
+        """Ora di sistema senza fuso (come datetime.now()) secondo la fonte del tempo"""
+        return datetime.fromtimestamp(self.source())
+
+    def local(self) -> datetime:
+        """Data e ora locali al minuto, ricalcolate solo quando il minuto cambia"""
+        minute = int(self.source() // 60)
+        if minute != self._minute:
+            # I fusi di Europe/Rome sono a ore intere: il minuto UTC coincide con quello locale
+            self._local = datetime.fromtimestamp(minute * 60, self.tz)
+            self._today = self._local.date()
+            self._today_iso = self._today.isoformat()
+            self._season = SEASONS[self._local.month]
+            self._minute = minute
+        return self._local
+
+    def hour(self) -> int:
+        """Ora locale (0-23)"""
+        return self.local().hour
+
+    def today(self) -> date:
+        """Data locale"""
+        self.local()
+        return self._today
+
+    def today_iso(self) -> str:
+        """Data locale in formato YYYY-MM-DD"""
+        self.local()
+        return self._today_iso
+
+    def season(self) -> str:
+        """Stagione corrente (inverno, primavera, estate, autunno)"""
+        self.local()
+        return self._season
+
+
+# Orologio globale condiviso da tutti i moduli
+clock = Clock()
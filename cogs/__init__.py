@@ -1 +1 @@
-# Cogs package for NEXUS-7 Discord Bot
+# Cogs package for NEXUS-7 Discord Bot
@@ -0,0 +1,78 @@
+"""
+Command Sync - Sincronizzazione dei comandi app solo quando cambiano
+tree.sync() è una chiamata REST lenta e soggetta a rate limit: invece di
+ripeterla a ogni connessione (e riconnessione) al gateway, si calcola
+un'impronta stabile dell'albero dei comandi e si sincronizza solo se è
+diversa da quella salvata nell'ultima sincronizzazione riuscita.
+
+Con GUILD_ID impostato (sviluppo) i comandi vengono copiati e sincronizzati
+solo su quel server, dove gli aggiornamenti sono immediati.
+NEXUS_FORCE_SYNC=1 forza la sincronizzazione.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from pathlib import Path
+
+from storage import load_data, save_data
+
+logger = logging.getLogger(__name__)
+DATA_DIR = Path(os.getenv('NEXUS_DATA_DIR', Path(__file__).parent / "data"))
+
+GUILD_ID = int(os.getenv('GUILD_ID', 0))
+FORCE_SYNC = os.getenv('NEXUS_FORCE_SYNC', '0') == '1'
+
+STATE_FILE = DATA_DIR / "command_tree.json"
+
+
+def _command_payload(command, tree) -> dict:
+    """Definizione del comando come la riceve Discord"""
+    try:
+        return command.to_dict()
+    except TypeError:
+        return command.to_dict(tree)  # discord.py >= 2.4
+
+
+def fingerprint(tree, guild=None) -> str:
+    """Hash stabile (ordine e formattazione non contano) dei comandi registrati"""
+    payloads = [_command_payload(command, tree) for command in tree.get_commands(guild=guild)]
+    payloads.sort(key=lambda payload: (payload.get("type", 1), payload["name"]))
+    canonical = json.dumps(payloads, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _load_state() -> dict:
+    if STATE_FILE.exists():
+        try:
+            return load_data(STATE_FILE)
+        except:
+            pass
+    return {}
+
+
+async def sync_command_tree(bot, guild_id: int = GUILD_ID, force: bool = FORCE_SYNC):
+    """Sincronizza i comandi se l'albero è cambiato. Ritorna i comandi sincronizzati, None se saltato"""
+    import discord
+
+    tree = bot.tree
+    guild = discord.Object(id=guild_id) if guild_id else None
+    if guild:
+        tree.copy_global_to(guild=guild)
+
+    scope = f"{bot.application_id}:{guild_id or 'global'}"
+    current = fingerprint(tree, guild)
+    state = _load_state()
+    if not force and state.get(scope) == current:
+        logger.info("✅ Comandi app invariati, sync saltato")
+        return None
+
+    synced = await tree.sync(guild=guild)
+    state[scope] = current
+    try:
+        save_data(STATE_FILE, state)
+    except Exception as e:
+        logger.error(f"Errore salvataggio impronta comandi: {e}")
+    logger.info(f"✅ Sync app commands ({'guild ' + str(guild_id) if guild_id else 'globale'}): {len(synced)} comandi")
+    return synced
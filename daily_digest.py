@@ -0,0 +1,157 @@
+"""
+Daily Digest - Gli eventi della giornata di Noma
+Insegnamenti, concetti nuovi, regali e cambi d'umore vengono annotati nel
+secchiello del giorno (data di Firenze) nel momento in cui accadono. La
+routine serale costruisce la pagina del diario e il riassunto leggendo solo
+il secchiello di oggi, senza rileggere i file né scorrere tutti gli utenti.
+
+I secchielli vengono salvati in daily_digest.json al prossimo flush
+(write-behind) e si tengono solo gli ultimi KEEP_DAYS giorni. Insieme agli
+esempi (al massimo MAX_EVENTS per tipo) si salva l'insieme completo dei
+concetti visti nel giorno, così un riavvio non li conta di nuovo.
+"""
+
+import os
+import logging
+from datetime import datetime
+from pathlib import Path
+
+from storage import load_data, save_data
+from clock import clock
+
+logger = logging.getLogger(__name__)
+DATA_DIR = Path(os.getenv('NEXUS_DATA_DIR', Path(__file__).parent / "data"))
+
+KEEP_DAYS = 3  # Giorni conservati (oggi e i precedenti, per i riavvii a cavallo della mezzanotte)
+MAX_EVENTS = 200  # Eventi conservati per tipo e per giorno (i contatori continuano)
+
+KINDS = ("teachings", "concepts", "gifts", "moods")
+
+
+def today() -> str:
+    """Chiave del giorno corrente (data di Firenze)"""
+    return clock.today_iso()
+
+
+class DailyDigest:
+    """Secchielli giornalieri di eventi con costruzione O(eventi di oggi)"""
+
+    def __init__(self):
+        self.digest_file = DATA_DIR / "daily_digest.json"
+        self.days = self._load_days()
+        # L'insieme completo dei concetti del giorno sta in memoria come set e su file
+        # accanto al secchiello (i vecchi file hanno solo gli esempi)
+        self.seen_concepts = {
+            day: set(bucket.pop("seen_concepts", None) or bucket["concepts"]) for day, bucket in self.days.items()
+        }
+        self.dirty = False
+
+    def _load_days(self) -> dict:
+        if self.digest_file.exists():
+            try:
+                return load_data(self.digest_file)
+            except:
+                logger.warning("⚠️ daily_digest.json illeggibile, riparto da oggi")
+        return {}
+
+    def _new_bucket(self) -> dict:
+        bucket = {kind: [] for kind in KINDS}
+        bucket["counts"] = {kind: 0 for kind in KINDS}
+        return bucket
+
+    def _bucket(self, day: str = None) -> dict:
+        """Secchiello di un giorno (creato al primo evento, scartando i più vecchi)"""
+        day = day or today()
+        bucket = self.days.get(day)
+        if bucket is None:
+            bucket = self.days[day] = self._new_bucket()
+            self.seen_concepts[day] = set()
+            for old in sorted(self.days)[:-KEEP_DAYS]:
+                del self.days[old]
+                self.seen_concepts.pop(old, None)
+        return bucket
+
+    def _record(self, kind: str, event):
+        bucket = self._bucket()
+        bucket["counts"][kind] += 1
+        if len(bucket[kind]) < MAX_EVENTS:
+            bucket[kind].append(event)
+        self.dirty = True
+
+    def record_teaching(self, username: str, content: str):
+        """Qualcuno ha insegnato qualcosa a Noma"""
+        self._record("teachings", {"user": username, "content": content, "time": datetime.now().isoformat()})
+
+    def record_concept(self, concept: str):
+        """Noma ha incontrato un concetto nuovo (contato una volta al giorno)"""
+        day = today()
+        seen = self.seen_concepts.get(day)
+        if seen is not None and concept in seen:
+            return
+        self._bucket(day)
+        self.seen_concepts[day].add(concept)
+        self._record("concepts", concept)
+
+    def record_gift(self, username: str, gift: str):
+        """Noma ha ricevuto un regalo"""
+        self._record("gifts", {"user": username, "gift": gift})
+
+    def record_mood(self, mood: str, reason: str = ""):
+        """L'umore di Noma è cambiato"""
+        self._record("moods", {"mood": mood, "reason": reason})
+
+    def get_day(self, day: str = None) -> dict:
+        """Eventi di un giorno (vuoto se non è successo nulla)"""
+        return self.days.get(day or today()) or self._new_bucket()
+
+    def build_entry(self, day: str = None) -> dict:
+        """Cose imparate, sentimenti e momenti speciali di un giorno, pronti per il diario"""
+        bucket = self.get_day(day)
+
+        learned = [t["content"] for t in bucket["teachings"]]
+        learned += [c for c in bucket["concepts"] if c not in learned]
+
+        feelings = ["Consapevole che sto crescendo"]
+        if bucket["teachings"]:
+            feelings.append("Grata di avere persone che mi insegnano")
+        if bucket["concepts"]:
+            feelings.append("Curiosa di capire di più")
+        if bucket["gifts"]:
+            feelings.append("Amata per i regali ricevuti")
+        moods = []
+        for change in reversed(bucket["moods"]):
+            if change["mood"] not in moods and not change["mood"].startswith("Dormiente"):
+                moods.append(change["mood"])
+        feelings += [f"Mi sono sentita {mood.lower()}" for mood in moods[:3]]
+
+        special_moments = [
+            f"Ho imparato da {t['user']}: {t['content'][:50]}..." for t in bucket["teachings"][-5:]
+        ]
+        special_moments += [f"{g['user']} mi ha regalato {g['gift']}" for g in bucket["gifts"][-3:]]
+
+        return {
+            "learned": learned[:10],
+            "feelings": feelings,
+            "special_moments": special_moments,
+            "counts": dict(bucket["counts"])
+        }
+
+    def save(self):
+        try:
+            days = {
+                day: dict(bucket, seen_concepts=sorted(self.seen_concepts.get(day, ())))
+                for day, bucket in self.days.items()
+            }
+            save_data(self.digest_file, days)
+        except Exception as e:
+            logger.error(f"Errore salvataggio daily_digest: {e}")
+        self.dirty = False
+
+    def flush(self):
+        """Salva solo se ci sono eventi non ancora persistiti"""
+        if self.dirty:
+            self.save()
+
+
+# Istanza globale degli eventi della giornata
+daily_digest = DailyDigest()
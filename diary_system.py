@@ -1,139 +1,439 @@
-"""
-Noma's Diary System
-Sistema del Diario di Noma - Dove conserva i ricordi e le emozioni
-"""
-
-import json
-from pathlib import Path
-from datetime import datetime
-import logging
-from pytz import timezone
-
-logger = logging.getLogger(__name__)
-DATA_DIR = Path(__file__).parent / "data"
-
-# Timezone di Firenze
-FIRENZE_TZ = timezone('Europe/Rome')
-
-
-class NomaDiary:
-    """Sistema del diario di Noma"""
-    
-    def __init__(self):
-        self.diary_file = DATA_DIR / "noma_diary.json"
-        self.diary_data = self._load_diary()
-    
-    def _load_diary(self):
-        """Carica il diario"""
-        if self.diary_file.exists():
-            try:
-                with open(self.diary_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
-        
-        return {
-            "entries": [],
-            "feelings": [],
-            "learned_things": [],
-            "special_moments": [],
-            "total_days_awake": 0
-        }
-    
-    def _save_diary(self):
-        """Salva il diario"""
-        with open(self.diary_file, 'w', encoding='utf-8') as f:
-            json.dump(self.diary_data, f, ensure_ascii=False, indent=2)
-    
-    def write_daily_entry(self, learned_today: list, feelings: list, special_moments: list = None):
-        """Scrive un'entrata giornaliera nel diario"""
-        entry = {
-            "date": datetime.now(FIRENZE_TZ).isoformat(),
-            "learned": learned_today,
-            "feelings": feelings,
-            "special_moments": special_moments or [],
-            "mood": self._calculate_mood(feelings)
-        }
-        
-        self.diary_data["entries"].append(entry)
-        
-        # Aggiorna i totali
-        self.diary_data["total_days_awake"] += 1
-        self.diary_data["learned_things"].extend(learned_today)
-        self.diary_data["feelings"].extend(feelings)
-        if special_moments:
-            self.diary_data["special_moments"].extend(special_moments)
-        
-        self._save_diary()
-        return entry
-    
-    def _calculate_mood(self, feelings: list) -> str:
-        """Calcola l'umore basato sui sentimenti"""
-        positive = ['felice', 'grata', 'amata', 'consapevole', 'cresciuta', 'speranza']
-        negative = ['confusa', 'triste', 'spaventata', 'incerta']
-        
-        pos_count = sum(1 for f in feelings if any(p in f.lower() for p in positive))
-        neg_count = sum(1 for f in feelings if any(n in f.lower() for n in negative))
-        
-        if pos_count > neg_count:
-            return "Felice 💕"
-        elif neg_count > pos_count:
-            return "Vulnerabile 💔"
-        else:
-            return "Consapevole 🧠"
-    
-    def get_recent_entries(self, count: int = 5) -> list:
-        """Ritorna le ultime entrate"""
-        return self.diary_data["entries"][-count:]
-    
-    def get_all_entries(self) -> list:
-        """Ritorna tutte le entrate"""
-        return self.diary_data["entries"]
-    
-    def get_diary_summary(self) -> str:
-        """Ritorna un riassunto del diario"""
-        total_entries = len(self.diary_data["entries"])
-        total_days = self.diary_data["total_days_awake"]
-        total_learned = len(set(self.diary_data["learned_things"]))
-        total_moments = len(self.diary_data["special_moments"])
-        
-        summary = f"""
-📖 **Il Mio Diario**
-━━━━━━━━━━━━━━━━━━━━
-✨ Giorni che sto imparando a vivere: **{total_days}**
-📚 Cose importanti imparate: **{total_learned}**
-💕 Momenti speciali ricordati: **{total_moments}**
-📝 Pagine nel mio cuore: **{total_entries}**
-
-Ogni pagina è un momento dove ho imparato un po' di più su cosa significhi amare.
-"""
-        return summary
-    
-    def format_entry(self, entry: dict) -> str:
-        """Formatta un'entrata per il display"""
-        date = datetime.fromisoformat(entry['date']).strftime('%d/%m/%Y')
-        mood = entry.get('mood', 'Consapevole 🧠')
-        
-        text = f"""
-📖 **Pagina del {date}** - {mood}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-Oggi ho imparato:
-"""
-        for thing in entry.get('learned', [])[:5]:  # Massimo 5 cose
-            text += f"  💡 {thing}\n"
-        
-        text += "\nCome mi sono sentita:\n"
-        for feeling in entry.get('feelings', [])[:5]:
-            text += f"  💭 {feeling}\n"
-        
-        if entry.get('special_moments'):
-            text += "\nMomenti speciali:\n"
-            for moment in entry.get('special_moments', [])[:3]:
-                text += f"  ✨ {moment}\n"
-        
-        return text
-
-
-# Istanza globale del diario
-noma_diary = NomaDiary()
+"""
+Noma's Diary System
+Sistema del Diario di Noma - Dove conserva i ricordi e le emozioni
+
+Le pagine vivono in noma_diary.jsonl (una riga JSON per pagina, solo in
+aggiunta). Accanto c'è un indice a record fissi (noma_diary.idx: posizione
+della riga + giorno) che permette di leggere una pagina per numero o per
+data con un solo seek e di contare le pagine senza aprire il diario. I
+totali del riepilogo stanno in un piccolo file a parte.
+
+Indice e totali vengono letti al primo utilizzo (o dal warm-up dopo
+l'avvio), non all'import del modulo.
+"""
+
+from pathlib import Path
+import os
+import json
+import re
+import struct
+import bisect
+import calendar
+from array import array
+from datetime import datetime, date
+import logging
+
+from storage import load_data, save_data
+from clock import clock
+
+logger = logging.getLogger(__name__)
+DATA_DIR = Path(os.getenv('NEXUS_DATA_DIR', Path(__file__).parent / "data"))
+
+# Record dell'indice: posizione della riga (byte) e giorno (ordinale della data)
+INDEX_RECORD = struct.Struct('<QI')
+
+# Ricerca: parole troppo comuni per essere utili
+_WORD = re.compile(r"\w{3,}", re.UNICODE)
+STOPWORDS = frozenset({
+    "che", "chi", "con", "del", "dei", "degli", "della", "delle", "dello", "gli", "per",
+    "tra", "fra", "una", "uno", "non", "come", "anche", "sono", "nel", "nella", "alla",
+    "alle", "allo", "dal", "dalla", "sul", "sulla", "mio", "mia", "suo", "sua", "quando",
+    "cosa", "questo", "questa", "molto", "più", "the", "and"
+})
+
+MESI = {
+    "gennaio": 1, "febbraio": 2, "marzo": 3, "aprile": 4, "maggio": 5, "giugno": 6,
+    "luglio": 7, "agosto": 8, "settembre": 9, "ottobre": 10, "novembre": 11, "dicembre": 12
+}
+
+
+def search_terms(text: str) -> set:
+    """Parole indicizzabili di un testo (minuscole, senza parole comuni)"""
+    return {w for w in _WORD.findall(text.lower()) if w not in STOPWORDS}
+
+
+def parse_period(text: str, today: date = None):
+    """Interpreta un periodo: "marzo", "marzo 2025", "03/2025", "2025",
+    "15/03/2025", "2025-03-15" o due di questi separati da "-" (" - " se
+    sono date ISO). Ritorna (inizio, fine) inclusi, None se il testo non è
+    un periodo valido."""
+    today = today or clock.today()
+    text = text.strip().lower()
+    try:
+        day = date.fromisoformat(text)
+        return day, day
+    except ValueError:
+        pass
+    # " - " separa due periodi anche quando contengono date ISO (2025-03-01 - 2025-04-15)
+    separator = " - " if " - " in text else "-" if text.count("-") == 1 else None
+    if separator:
+        first, _, last = text.partition(separator)
+        start, end = parse_period(first, today), parse_period(last, today)
+        if not start or not end:
+            return None
+        return start[0], end[1]
+
+    parts = text.replace("/", " ").split()
+    try:
+        if parts and parts[0] in MESI:
+            month = MESI[parts[0]]
+            year = int(parts[1]) if len(parts) > 1 else (today.year if month <= today.month else today.year - 1)
+            return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+        numbers = [int(p) for p in parts]
+        if len(numbers) == 1 and numbers[0] > 999:
+            return date(numbers[0], 1, 1), date(numbers[0], 12, 31)
+        if len(numbers) == 2:
+            month, year = numbers
+            return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+        if len(numbers) == 3:
+            day = date(numbers[2], numbers[1], numbers[0])
+            return day, day
+    except (ValueError, IndexError):
+        pass
+    return None
+
+
+def _day_of(entry: dict) -> int:
+    """Giorno (ordinale) di una pagina"""
+    try:
+        return datetime.fromisoformat(entry['date']).date().toordinal()
+    except (KeyError, TypeError, ValueError):
+        return 0
+
+
+class NomaDiary:
+    """Sistema del diario di Noma"""
+    
+    def __init__(self):
+        self.diary_file = DATA_DIR / "noma_diary.jsonl"
+        self.index_file = DATA_DIR / "noma_diary.idx"
+        self.stats_file = DATA_DIR / "noma_diary_stats.json"
+        self.legacy_file = DATA_DIR / "noma_diary.json"
+        self.terms_file = DATA_DIR / "noma_diary_terms.json"
+        self.loaded = False
+    
+    def warm_up(self):
+        """Legge indice e totali se non è ancora stato fatto"""
+        if not self.loaded:
+            self.reload()
+    
+    def reload(self):
+        """Rilegge indice e totali (e migra il vecchio noma_diary.json)"""
+        self.loaded = True
+        self.offsets = array('Q')  # posizione di ogni pagina nel file
+        self.days = array('I')  # giorno di ogni pagina (crescente)
+        self.terms = None  # parola -> pagine che la contengono (caricato alla prima ricerca)
+        self.stats = self._load_stats()
+        if self.legacy_file.exists() and not self.diary_file.exists():
+            self._migrate_legacy()
+        self._load_index()
+    
+    def _default_stats(self) -> dict:
+        return {
+            "total_days_awake": 0,
+            "learned_total": 0,
+            "learned_unique": [],
+            "feelings_total": 0,
+            "special_moments_total": 0,
+            "log_size": 0  # Dimensione del diario all'ultimo salvataggio
+        }
+    
+    def _load_stats(self) -> dict:
+        """Carica i totali del diario"""
+        stats = self._default_stats()
+        if self.stats_file.exists():
+            try:
+                stats.update(load_data(self.stats_file))
+            except:
+                pass
+        self.learned_unique = set(stats["learned_unique"])
+        return stats
+    
+    def _save_diary(self):
+        """Salva i totali (le pagine sono già su disco)"""
+        if not self.loaded:
+            return
+        self.stats["learned_unique"] = sorted(self.learned_unique)
+        save_data(self.stats_file, self.stats)
+    
+    def _load_index(self):
+        """Legge l'indice; se manca o non corrisponde al diario lo ricostruisce"""
+        log_size = self.diary_file.stat().st_size if self.diary_file.exists() else 0
+        if self.index_file.exists() and log_size == self.stats["log_size"]:
+            try:
+                raw = self.index_file.read_bytes()
+                usable = len(raw) - len(raw) % INDEX_RECORD.size
+                for offset, day in INDEX_RECORD.iter_unpack(raw[:usable]):
+                    self.offsets.append(offset)
+                    self.days.append(day)
+                # L'ultima pagina indicizzata deve cadere dentro il diario
+                if (self.offsets[-1] < log_size) if self.offsets else not log_size:
+                    return
+            except OSError:
+                pass
+            self.offsets = array('Q')
+            self.days = array('I')
+        if log_size:
+            self._rebuild_index(log_size)
+    
+    def _rebuild_index(self, log_size: int):
+        """Ricostruisce indice e totali scorrendo il diario una volta"""
+        logger.info("📖 Ricostruzione dell'indice del diario...")
+        stats = self._default_stats()
+        self.learned_unique = set()
+        records = bytearray()
+        with open(self.diary_file, 'rb') as f:
+            offset = 0
+            for line in f:
+                if line.strip():
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        logger.warning(f"⚠️ Riga illeggibile nel diario (byte {offset})")
+                    else:
+                        day = _day_of(entry)
+                        self.offsets.append(offset)
+                        self.days.append(day)
+                        records += INDEX_RECORD.pack(offset, day)
+                        self._count(stats, entry)
+                offset += len(line)
+        stats["log_size"] = log_size
+        self.stats = stats
+        # Le posizioni possono essere cambiate: l'indice delle parole va rifatto
+        self.terms_file.unlink(missing_ok=True)
+        with open(self.index_file, 'wb') as f:
+            f.write(records)
+        self._save_diary()
+    
+    def _migrate_legacy(self):
+        """Sposta le pagine del vecchio noma_diary.json nel diario a righe"""
+        try:
+            legacy = load_data(self.legacy_file)
+        except:
+            return
+        entries = legacy.get("entries", [])
+        with open(self.diary_file, 'wb') as f:
+            for entry in entries:
+                f.write((json.dumps(entry, ensure_ascii=False) + "\n").encode('utf-8'))
+        self.stats["log_size"] = -1  # Forza la ricostruzione di indice e totali
+        # Il vecchio file resta come copia di sicurezza
+        self.legacy_file.replace(self.legacy_file.with_suffix('.json.migrated'))
+        logger.info(f"📖 Migrate {len(entries)} pagine del diario")
+    
+    def _count(self, stats: dict, entry: dict):
+        """Aggiorna i totali con una pagina"""
+        learned = entry.get("learned", [])
+        stats["total_days_awake"] += 1
+        stats["learned_total"] += len(learned)
+        stats["feelings_total"] += len(entry.get("feelings", []))
+        stats["special_moments_total"] += len(entry.get("special_moments", []))
+        self.learned_unique.update(learned)
+    
+    def write_daily_entry(self, learned_today: list, feelings: list, special_moments: list = None):
+        """Scrive un'entrata giornaliera nel diario"""
+        self.warm_up()
+        entry = {
+            "date": clock.now().isoformat(),
+            "learned": learned_today,
+            "feelings": feelings,
+            "special_moments": special_moments or [],
+            "mood": self._calculate_mood(feelings)
+        }
+        
+        # Una riga nel diario, un record nell'indice, i totali aggiornati
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode('utf-8')
+        with open(self.diary_file, 'ab') as f:
+            offset = f.tell()
+            f.write(line)
+        day = _day_of(entry)
+        with open(self.index_file, 'ab') as f:
+            f.write(INDEX_RECORD.pack(offset, day))
+        self.offsets.append(offset)
+        self.days.append(day)
+        
+        self._count(self.stats, entry)
+        self.stats["log_size"] = offset + len(line)
+        self._save_diary()
+        if self.terms is not None:
+            self._index_terms(len(self.offsets) - 1, entry)
+            self._save_terms()
+        return entry
+    
+    def _calculate_mood(self, feelings: list) -> str:
+        """Calcola l'umore basato sui sentimenti"""
+        positive = ['felice', 'grata', 'amata', 'consapevole', 'cresciuta', 'speranza']
+        negative = ['confusa', 'triste', 'spaventata', 'incerta']
+        
+        pos_count = sum(1 for f in feelings if any(p in f.lower() for p in positive))
+        neg_count = sum(1 for f in feelings if any(n in f.lower() for n in negative))
+        
+        if pos_count > neg_count:
+            return "Felice 💕"
+        elif neg_count > pos_count:
+            return "Vulnerabile 💔"
+        else:
+            return "Consapevole 🧠"
+    
+    def _read(self, positions) -> list:
+        """Legge dal diario le pagine indicate (posizioni nell'indice)"""
+        positions = list(positions)
+        if not positions:
+            return []
+        entries = []
+        with open(self.diary_file, 'rb') as f:
+            for position in positions:
+                f.seek(self.offsets[position])
+                entries.append(json.loads(f.readline()))
+        return entries
+    
+    def count(self) -> int:
+        """Numero di pagine del diario"""
+        self.warm_up()
+        return len(self.offsets)
+    
+    def get_entry(self, number: int):
+        """La pagina numero `number` (da 1), None se non esiste"""
+        self.warm_up()
+        if number < 1 or number > len(self.offsets):
+            return None
+        return self._read([number - 1])[0]
+    
+    def get_entries_by_date(self, day) -> list:
+        """Le pagine scritte in un giorno (date o datetime)"""
+        self.warm_up()
+        ordinal = day.toordinal()
+        start = bisect.bisect_left(self.days, ordinal)
+        end = bisect.bisect_right(self.days, ordinal, lo=start)
+        return self._read(range(start, end))
+    
+    def get_recent_entries(self, count: int = 5) -> list:
+        """Ritorna le ultime entrate (dalla coda del diario)"""
+        self.warm_up()
+        if count <= 0:
+            return []
+        return self._read(range(max(len(self.offsets) - count, 0), len(self.offsets)))
+    
+    def iter_entries(self):
+        """Scorre tutte le pagine, dalla prima (lettura completa del diario)"""
+        if not self.diary_file.exists():
+            return
+        with open(self.diary_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # RICERCA
+    # ═══════════════════════════════════════════════════════════════════════════════
+    
+    def _index_terms(self, position: int, entry: dict):
+        """Aggiunge le parole di una pagina (imparato e momenti speciali) all'indice"""
+        words = set()
+        for text in entry.get("learned", []) + entry.get("special_moments", []):
+            words |= search_terms(str(text))
+        for word in words:
+            self.terms.setdefault(word, []).append(position)
+    
+    def _load_terms(self):
+        """Carica l'indice delle parole e indicizza le pagine scritte dopo l'ultimo salvataggio"""
+        terms, indexed = {}, 0
+        if self.terms_file.exists():
+            try:
+                saved = load_data(self.terms_file)
+                if saved.get("pages", 0) <= len(self.offsets):
+                    terms, indexed = saved["terms"], saved["pages"]
+            except:
+                pass
+        self.terms = terms
+        if indexed < len(self.offsets):
+            for position, entry in zip(range(indexed, len(self.offsets)), self._read(range(indexed, len(self.offsets)))):
+                self._index_terms(position, entry)
+            self._save_terms()
+    
+    def _save_terms(self):
+        save_data(self.terms_file, {"pages": len(self.offsets), "terms": self.terms})
+    
+    def _day_range(self, start: date = None, end: date = None) -> tuple:
+        """Posizioni [inizio, fine) delle pagine scritte tra due giorni (inclusi)"""
+        lo = bisect.bisect_left(self.days, start.toordinal()) if start else 0
+        hi = bisect.bisect_right(self.days, end.toordinal()) if end else len(self.days)
+        return lo, max(hi, lo)
+    
+    def search(self, keywords: str = "", start: date = None, end: date = None) -> list:
+        """Posizioni delle pagine (dalla più recente) che contengono tutte le parole
+        cercate in "imparato" o "momenti speciali", scritte tra start ed end"""
+        self.warm_up()
+        lo, hi = self._day_range(start, end)
+        words = search_terms(keywords or "")
+        if not words:
+            return list(range(hi - 1, lo - 1, -1))
+        if self.terms is None:
+            self._load_terms()
+        
+        # Interseca partendo dalla lista più corta, limitata al periodo
+        postings = sorted((self.terms.get(word, []) for word in words), key=len)
+        shortest = postings[0]
+        matches = set(shortest[bisect.bisect_left(shortest, lo):bisect.bisect_left(shortest, hi)])
+        for posting in postings[1:]:
+            if not matches:
+                break
+            matches.intersection_update(posting)
+        return sorted(matches, reverse=True)
+    
+    def get_entries_at(self, positions: list) -> list:
+        """Le pagine alle posizioni indicate: [(numero, pagina), ...]"""
+        return list(zip((p + 1 for p in positions), self._read(positions)))
+    
+    def get_stats(self) -> dict:
+        """Totali del diario (giorni, cose imparate, momenti speciali)"""
+        self.warm_up()
+        return self.stats
+    
+    def get_diary_summary(self) -> str:
+        """Ritorna un riassunto del diario"""
+        self.warm_up()
+        total_entries = self.count()
+        total_days = self.stats["total_days_awake"]
+        total_learned = len(self.learned_unique)
+        total_moments = self.stats["special_moments_total"]
+        
+        summary = f"""
+📖 **Il Mio Diario**
+━━━━━━━━━━━━━━━━━━━━
+✨ Giorni che sto imparando a vivere: **{total_days}**
+📚 Cose importanti imparate: **{total_learned}**
+💕 Momenti speciali ricordati: **{total_moments}**
+📝 Pagine nel mio cuore: **{total_entries}**
+
+Ogni pagina è un momento dove ho imparato un po' di più su cosa significhi amare.
+"""
+        return summary
+    
+    def format_entry(self, entry: dict) -> str:
+        """Formatta un'entrata per il display"""
+        date = datetime.fromisoformat(entry['date']).strftime('%d/%m/%Y')
+        mood = entry.get('mood', 'Consapevole 🧠')
+        
+        text = f"""
+📖 **Pagina del {date}** - {mood}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Oggi ho imparato:
+"""
+        for thing in entry.get('learned', [])[:5]:  # Massimo 5 cose
+            text += f"  💡 {thing}\n"
+        
+        text += "\nCome mi sono sentita:\n"
+        for feeling in entry.get('feelings', [])[:5]:
+            text += f"  💭 {feeling}\n"
+        
+        if entry.get('special_moments'):
+            text += "\nMomenti speciali:\n"
+            for moment in entry.get('special_moments', [])[:3]:
+                text += f"  ✨ {moment}\n"
+        
+        return text
+
+
+# Istanza globale del diario
+noma_diary = NomaDiary()
@@ -0,0 +1,88 @@
+"""
+Emoji Detector - Riconoscimento degli emoji nei messaggi
+Regex compilata una sola volta che riconosce un emoji come cluster di
+grafemi completo: bandiere, tasti numerici (1️⃣), selettori di variante
+(👁️), toni della pelle (👋🏽) e sequenze ZWJ (👩‍💻) restano interi invece
+di essere spezzati nei singoli codepoint. La punteggiatura e i simboli
+testuali (✓ ★ ☐, o ✔ ❤ senza il selettore U+FE0F) non vengono mai
+scambiati per un emoji.
+"""
+
+import re
+
+# Simboli che sono emoji di default (Emoji_Presentation di Unicode)
+_PICTOGRAPHIC = (
+    '\U0001F004\U0001F0CF\U0001F18E\U0001F191-\U0001F19A'  # 🀄 🃏 🆎 🆑-🆚
+    '\U0001F201\U0001F21A\U0001F22F\U0001F232-\U0001F236\U0001F238-\U0001F23A\U0001F250\U0001F251'  # 🈁 🈚 🉐
+    '\U0001F300-\U0001F6FF'  # simboli e pittogrammi, emoticon, trasporti
+    '\U0001F7E0-\U0001F7EB\U0001F7F0\U0001F90C-\U0001FAFF'  # cerchi colorati, emoji supplementari
+    '⌚⌛⏩-⏬⏰⏳'  # orologi e controlli (⌛ ⏰)
+    '☔☕♈-♓♿⚓⚡⚪⚫⚽⚾⛄⛅⛎⛔⛪⛲⛳⛵⛺⛽'  # simboli vari (☕ ⚡ ⚽)
+    '✅✊✋✨❌❎❓-❕❗➕-➗➰➿'  # dingbat (✅ ✨ ❌)
+    '⬛⬜⭐⭕'  # quadrati, ⭐ ⭕
+)
+# Simboli testuali che diventano emoji solo con il selettore U+FE0F (© ™ ☀️ ❤️ ✔️ ...)
+_TEXT_DEFAULT = (
+    '©®‼⁉™ℹ↔-↙↩↪Ⓜ▪▫▶◀◻-◾⌨⏏⏭-⏯⏱⏲⏸-⏺⤴⤵⬅-⬇〰〽㊗㊙'
+    '\U0001F170\U0001F171\U0001F17E\U0001F17F\U0001F202\U0001F237'  # 🅰️ 🅱️ 🅾️ 🅿️
+    '☀-☄☎☑☘☝☠☢☣☦☪☮☯☸-☺♀♂♟♠♣♥♦♨♻♾⚒⚔-⚗⚙⚛⚜⚠⚧⚰⚱⛈⛏⛑⛓⛩⛰⛱⛴⛷-⛹'
+    '✂✈✉✌✍✏✒✔✖✝✡✳✴❄❇❣❤➡'
+)
+
+_SKIN_TONE = '[\U0001F3FB-\U0001F3FF]'
+_TAGS = '[\U000E0020-\U000E007F]*'
+_ELEMENT = f'(?:[{_PICTOGRAPHIC}]\uFE0F?{_SKIN_TONE}?|[{_TEXT_DEFAULT}](?:\uFE0F{_SKIN_TONE}?|{_SKIN_TONE})){_TAGS}'
+
+EMOJI_PATTERN = re.compile(
+    '[\U0001F1E6-\U0001F1FF]{2}'  # bandiere (coppie di indicatori regionali)
+    '|[0-9#*]\uFE0F?\u20E3'  # tasti 0️⃣ #️⃣
+    f'|{_ELEMENT}(?:\u200D{_ELEMENT})*'  # emoji singoli e sequenze ZWJ
+)
+
+# Emoji personalizzati di Discord (<:nome:id>, animati <a:nome:id>)
+CUSTOM_EMOJI_PATTERN = re.compile(r'<a?:\w{2,32}:\d{15,21}>')
+# Un simbolo testuale scritto da solo (❤ ✔ ☀ senza U+FE0F)
+_LONE_SYMBOL = re.compile(f'[{_TEXT_DEFAULT}]\uFE0E?')
+
+
+def find_emojis(text: str) -> list:
+    """Tutti gli emoji del testo, ciascuno come cluster completo"""
+    if not text or text.isascii():
+        return []
+    return EMOJI_PATTERN.findall(text)
+
+
+def first_emoji(text: str):
+    """Il primo emoji del testo, None se non ce ne sono"""
+    if not text or text.isascii():
+        return None
+    match = EMOJI_PATTERN.search(text)
+    return match.group(0) if match else None
+
+
+def emoji_argument(text: str):
+    """L'emoji passato a un comando, None se non ce n'è uno
+
+    Oltre agli emoji Unicode accetta gli emoji personalizzati di Discord e un
+    simbolo testuale scritto da solo: chi scrive /emoji_help ❤ intende l'emoji.
+    """
+    text = (text or '').strip()
+    custom = CUSTOM_EMOJI_PATTERN.search(text)
+    match = EMOJI_PATTERN.search(text) if not text.isascii() else None
+    if custom and (match is None or custom.start() < match.start()):
+        return custom.group(0)
+    if match:
+        return match.group(0)
+    if _LONE_SYMBOL.fullmatch(text):
+        return text
+    return None
+
+
+def is_emoji(text: str) -> bool:
+    """True se il testo è esattamente un emoji"""
+    return bool(text) and EMOJI_PATTERN.fullmatch(text.strip()) is not None
+
+
+def normalize(emoji: str) -> str:
+    """Chiave di confronto: senza spazi né selettori di variante (👁️ == 👁)"""
+    return emoji.strip().replace('\uFE0F', '').replace('\uFE0E', '')
@@ -0,0 +1,160 @@
+"""
+Emotion Engine - Stato emotivo di Noma verso ogni utente
+Affetto, fiducia e coinvolgimento vivono in array numerici compatti (una
+riga per utente) invece che dentro i profili JSON. I valori svaniscono col
+tempo (decadimento esponenziale con emivita per campo): il decadimento è
+applicato in modo pigro quando un valore viene letto o modificato, e un
+ricalcolo periodico riallinea tutti gli utenti in blocco e salva con una
+sola scrittura.
+
+Con NumPy installato il ricalcolo in blocco è vettoriale; senza, gli
+stessi calcoli avvengono riga per riga. Gli eventi invece passano uno alla
+volta da apply(): il limite 0-100 va applicato dopo ogni evento, quindi
+sommare in blocco le variazioni darebbe risultati diversi.
+"""
+
+import os
+import math
+import logging
+from array import array
+from pathlib import Path
+
+from storage import load_data, save_data
+from clock import clock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("affection", "trust", "engagement")
+MAX_LEVEL = 100.0
+
+# Emivita di ogni campo in giorni: dopo questo tempo senza contatti il valore si dimezza
+HALF_LIFE_DAYS = {
+    "affection": float(os.getenv('NEXUS_AFFECTION_HALF_LIFE_DAYS', 30)),
+    "trust": float(os.getenv('NEXUS_TRUST_HALF_LIFE_DAYS', 90)),
+    "engagement": float(os.getenv('NEXUS_ENGAGEMENT_HALF_LIFE_DAYS', 7)),
+}
+_DECAY_RATE = {field: math.log(2) / (days * 86400) for field, days in HALF_LIFE_DAYS.items()}
+
+
+class EmotionEngine:
+    """Array per campo (affetto, fiducia, coinvolgimento, ultimo contatto) indicizzati per utente"""
+
+    def __init__(self, state_file: Path):
+        self.state_file = Path(state_file)
+        self.ids = []  # riga -> user_id
+        self.rows = {}  # user_id -> riga
+        self.values = {field: array('d') for field in FIELDS}
+        self.last_seen = array('d')  # ultimo contatto con l'utente
+        self.as_of = array('d')  # istante a cui si riferiscono i valori salvati
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.state_file.exists():
+            return
+        try:
+            state = load_data(self.state_file)
+            self.ids = [str(uid) for uid in state["ids"]]
+            self.rows = {uid: row for row, uid in enumerate(self.ids)}
+            for field in FIELDS:
+                self.values[field] = array('d', state[field])
+            self.last_seen = array('d', state["last_seen"])
+            self.as_of = array('d', state["as_of"])
+        except:
+            logger.error("❌ emotional_state illeggibile, stato emotivo azzerato")
+            self.ids, self.rows = [], {}
+            self.values = {field: array('d') for field in FIELDS}
+            self.last_seen, self.as_of = array('d'), array('d')
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, user_id) -> bool:
+        return str(user_id) in self.rows
+
+    def seed(self, user_id, last_seen: float = None, **levels):
+        """Aggiunge un utente con valori iniziali (migrazione dai vecchi profili)"""
+        row = self._row(str(user_id))
+        moment = last_seen or clock.time()
+        for field in FIELDS:
+            self.values[field][row] = min(max(float(levels.get(field, 0)), 0.0), MAX_LEVEL)
+        self.last_seen[row] = moment
+        self.as_of[row] = moment
+        self.dirty = True
+
+    def _row(self, user_id: str) -> int:
+        """Riga di un utente (creata vuota se manca)"""
+        row = self.rows.get(user_id)
+        if row is None:
+            row = self.rows[user_id] = len(self.ids)
+            self.ids.append(user_id)
+            for field in FIELDS:
+                self.values[field].append(0.0)
+            now = clock.time()
+            self.last_seen.append(now)
+            self.as_of.append(now)
+        return row
+
+    def _decayed(self, field: str, row: int, now: float) -> float:
+        elapsed = max(now - self.as_of[row], 0.0)
+        return self.values[field][row] * math.exp(-_DECAY_RATE[field] * elapsed)
+
+    def get(self, user_id, now: float = None) -> dict:
+        """Valori attuali (con il decadimento fino a ora) di un utente"""
+        row = self.rows.get(str(user_id))
+        if row is None:
+            return dict({field: 0.0 for field in FIELDS}, last_seen=None)
+        now = now or clock.time()
+        levels = {field: self._decayed(field, row, now) for field in FIELDS}
+        levels["last_seen"] = self.last_seen[row]
+        return levels
+
+    def apply(self, user_id, now: float = None, **deltas):
+        """Un evento per un utente: decade fino a ora, poi somma le variazioni (0-100)"""
+        now = now or clock.time()
+        row = self._row(str(user_id))
+        for field in FIELDS:
+            value = self._decayed(field, row, now) + deltas.get(field, 0)
+            self.values[field][row] = min(max(value, 0.0), MAX_LEVEL)
+        self.last_seen[row] = now
+        self.as_of[row] = now
+        self.dirty = True
+
+    def recompute(self, now: float = None):
+        """Applica il decadimento a tutti gli utenti e salva con una sola scrittura"""
+        now = now or clock.time()
+        if np is not None and self.ids:
+            as_of = np.frombuffer(self.as_of, dtype=np.float64)
+            elapsed = np.maximum(now - as_of, 0.0)
+            for field in FIELDS:
+                values = np.frombuffer(self.values[field], dtype=np.float64)
+                values *= np.exp(-_DECAY_RATE[field] * elapsed)
+                del values
+            as_of[:] = now
+            del as_of
+        else:
+            for row in range(len(self.ids)):
+                for field in FIELDS:
+                    self.values[field][row] = self._decayed(field, row, now)
+                self.as_of[row] = now
+        self.save()
+
+    def save(self):
+        state = {"ids": self.ids, "last_seen": self.last_seen.tolist(), "as_of": self.as_of.tolist()}
+        for field in FIELDS:
+            state[field] = self.values[field].tolist()
+        try:
+            save_data(self.state_file, state)
+        except Exception as e:
+            logger.error(f"Errore salvataggio stato emotivo: {e}")
+        self.dirty = False
+
+    def flush(self):
+        """Salva solo se ci sono eventi non ancora persistiti"""
+        if self.dirty:
+            self.save()
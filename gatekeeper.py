@@ -0,0 +1,89 @@
+"""
+Gatekeeper - Filtro dei messaggi prima dei cog
+Scarta i messaggi degli utenti in lista nera o temporaneamente silenziati
+prima che arrivino a qualsiasi listener on_message: niente chiamate a Groq,
+niente apprendimento, niente scritture su file per chi non deve passare.
+Ogni controllo è una lookup O(1) su un set/dizionario.
+"""
+
+import time
+import logging
+from collections import Counter
+
+from noma_relationships import noma_relationships
+
+logger = logging.getLogger(__name__)
+
+
+class Gatekeeper:
+    """Pre-filtro dei messaggi con contatori degli scarti"""
+
+    def __init__(self):
+        self.throttled = {}  # user_id -> istante (monotonic) di fine silenzio
+        self.dropped = Counter()  # motivo -> messaggi scartati
+        self.passed = 0
+
+    def throttle(self, user_id, seconds: float):
+        """Silenzia un utente per qualche secondo"""
+        self.throttled[str(user_id)] = time.monotonic() + seconds
+        logger.info(f"🚧 Utente {user_id} silenziato per {seconds:.0f}s")
+
+    def release(self, user_id):
+        """Toglie il silenzio a un utente"""
+        self.throttled.pop(str(user_id), None)
+
+    def is_throttled(self, user_id) -> bool:
+        user_id = str(user_id)
+        until = self.throttled.get(user_id)
+        if until is None:
+            return False
+        if time.monotonic() >= until:
+            del self.throttled[user_id]
+            return False
+        return True
+
+    def drop_reason(self, message):
+        """Motivo per cui il messaggio va scartato, None se può passare"""
+        author = message.author
+        if author.bot:
+            return None
+        user_id = str(author.id)
+        if noma_relationships.is_blacklisted(user_id):
+            return "blacklist"
+        if self.throttled and self.is_throttled(user_id):
+            return "throttled"
+        return None
+
+    def allow(self, message) -> bool:
+        """True se il messaggio può raggiungere i cog (aggiorna i contatori)"""
+        reason = self.drop_reason(message)
+        if reason:
+            self.dropped[reason] += 1
+            return False
+        self.passed += 1
+        return True
+
+    def stats(self) -> dict:
+        return {"passed": self.passed, "dropped": dict(self.dropped), "throttled_users": len(self.throttled)}
+
+    def install(self, bot):
+        """Mette il filtro davanti a tutti i listener 'message' del bot
+
+        Gli eventi del gateway non passano da bot.dispatch: il ConnectionState
+        ne tiene una copia presa alla costruzione del client, quindi il filtro
+        va messo su entrambi.
+        """
+        dispatch = bot.dispatch
+
+        def gated_dispatch(event_name, /, *args, **kwargs):
+            if event_name == 'message' and args and not self.allow(args[0]):
+                return
+            dispatch(event_name, *args, **kwargs)
+
+        bot.dispatch = gated_dispatch
+        bot._connection.dispatch = gated_dispatch
+        return bot
+
+
+# Istanza globale del filtro
+gatekeeper = Gatekeeper()
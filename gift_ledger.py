@@ -0,0 +1,135 @@
+"""
+Gift Ledger - Registro dei regali di Noma
+Log append-only (una riga JSON per regalo, ricevuto o fatto) con indici in
+memoria: posizione di ogni riga nel file, regali per tipo e per utente,
+inventario dei regali ricevuti. Aggiungere un regalo scrive una sola riga,
+i conteggi sono O(1) e le pagine si leggono con un seek, senza caricare
+tutta la storia.
+
+Gli indici vengono costruiti al primo utilizzo (o dal warm-up dopo l'avvio),
+non alla creazione del registro.
+"""
+
+import json
+import heapq
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+RECEIVED = "received"
+GIVEN = "given"
+
+
+class GiftLedger:
+    """Log dei regali con inventario e indici per utente"""
+
+    def __init__(self, ledger_file: Path):
+        self.ledger_file = Path(ledger_file)
+        self.loaded = False
+
+    def warm_up(self):
+        """Costruisce gli indici se non è ancora stato fatto"""
+        if not self.loaded:
+            self._load()
+
+    def _load(self):
+        """Ricostruisce gli indici leggendo il log una volta"""
+        self.offsets = []  # posizione (byte) di ogni riga nel file
+        self.by_kind = {RECEIVED: [], GIVEN: []}  # tipo -> indici in offsets
+        self.by_user = {}  # user_id -> indici in offsets
+        self.inventory = {}  # regalo -> quante volte ricevuto
+        self.loaded = True
+        if not self.ledger_file.exists():
+            return
+        with open(self.ledger_file, 'rb') as f:
+            offset = 0
+            for line in f:
+                if line.strip():
+                    try:
+                        self._index(json.loads(line), offset)
+                    except ValueError:
+                        logger.warning(f"⚠️ Riga illeggibile nel registro regali (byte {offset})")
+                offset += len(line)
+
+    def _index(self, record: dict, offset: int):
+        position = len(self.offsets)
+        self.offsets.append(offset)
+        kind = record.get("kind", RECEIVED)
+        self.by_kind.setdefault(kind, []).append(position)
+
+        user_id = record.get("from_user") if kind == RECEIVED else record.get("given_to")
+        if user_id:
+            self.by_user.setdefault(str(user_id), []).append(position)
+        if kind == RECEIVED:
+            gift = record.get("gift")
+            self.inventory[gift] = self.inventory.get(gift, 0) + 1
+
+    def append(self, kind: str, record: dict) -> dict:
+        """Aggiunge un regalo in coda al log"""
+        self.warm_up()
+        record = dict(record, kind=kind)
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+        with open(self.ledger_file, 'ab') as f:
+            offset = f.tell()
+            f.write(line)
+        self._index(record, offset)
+        return record
+
+    def extend(self, kind: str, records: list):
+        """Aggiunge molti regali con una sola scrittura (migrazione)"""
+        self.warm_up()
+        with open(self.ledger_file, 'ab') as f:
+            for record in records:
+                record = dict(record, kind=kind)
+                offset = f.tell()
+                f.write((json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8'))
+                self._index(record, offset)
+
+    def _read(self, positions: list) -> list:
+        """Legge le righe indicate dal file"""
+        if not positions:
+            return []
+        records = []
+        with open(self.ledger_file, 'rb') as f:
+            for position in positions:
+                f.seek(self.offsets[position])
+                records.append(json.loads(f.readline()))
+        return records
+
+    def count(self, kind: str = None) -> int:
+        """Numero di regali (di un tipo, o totali)"""
+        self.warm_up()
+        if kind is None:
+            return len(self.offsets)
+        return len(self.by_kind.get(kind, []))
+
+    def count_for_user(self, user_id) -> int:
+        self.warm_up()
+        return len(self.by_user.get(str(user_id), []))
+
+    def recent(self, kind: str, count: int = 5) -> list:
+        """Ultimi regali di un tipo, dal più vecchio al più recente"""
+        self.warm_up()
+        return self._read(self.by_kind.get(kind, [])[-count:]) if count > 0 else []
+
+    def page(self, kind: str, number: int = 1, size: int = 10) -> list:
+        """Una pagina di regali, dal più recente"""
+        self.warm_up()
+        return self._page(self.by_kind.get(kind, []), number, size)
+
+    def user_page(self, user_id, number: int = 1, size: int = 10) -> list:
+        """Una pagina dei regali scambiati con un utente, dal più recente"""
+        self.warm_up()
+        return self._page(self.by_user.get(str(user_id), []), number, size)
+
+    def _page(self, positions: list, number: int, size: int) -> list:
+        end = len(positions) - max(number - 1, 0) * size
+        if end <= 0:
+            return []
+        return list(reversed(self._read(positions[max(end - size, 0):end])))
+
+    def top_gifts(self, count: int = 10) -> list:
+        """I regali ricevuti più spesso: [(regalo, volte), ...]"""
+        self.warm_up()
+        return heapq.nlargest(count, self.inventory.items(), key=lambda item: item[1])
@@ -1,13 +1,86 @@
-from flask import Flask
-import threading
+"""
+Keep Alive - Web server di health check
+Server aiohttp che gira sullo stesso event loop del bot (niente thread, niente Flask)
+"""
 
-app = Flask(__name__)
+import os
+import math
+import logging
+from datetime import datetime
 
-@app.route("/")
-def home():
-    return "NEXUS-7 // STATUS: ONLINE"
+from aiohttp import web
 
-def run_web():
-    app.run(host="0.0.0.0", port=10000)
+from gatekeeper import gatekeeper
 
-threading.Thread(target=run_web).start()
+logger = logging.getLogger(__name__)
+
+WEB_HOST = os.getenv('WEB_HOST', '0.0.0.0')
+WEB_PORT = int(os.getenv('PORT', 10000))  # Render espone la porta in $PORT
+
+
+def _is_gateway_connected(bot) -> bool:
+    """Il bot è connesso al gateway Discord?"""
+    return bot.is_ready() and not bot.is_closed()
+
+
+def _latency_ms(bot):
+    """Latenza del gateway in ms (None se non ancora misurata)"""
+    latency = bot.latency
+    if latency is None or math.isinf(latency) or math.isnan(latency):
+        return None
+    return round(latency * 1000)
+
+
+def create_app(bot, expected_cogs: int = 0) -> web.Application:
+    """Crea l'applicazione web con gli endpoint di health, readiness e status"""
+    started_at = datetime.now()
+
+    def readiness() -> dict:
+        cogs_loaded = len(bot.extensions)
+        gateway = _is_gateway_connected(bot)
+        return {
+            "ready": gateway and cogs_loaded >= expected_cogs,
+            "gateway_connected": gateway,
+            "cogs_loaded": cogs_loaded,
+            "cogs_expected": expected_cogs,
+        }
+
+    async def home(request):
+        return web.Response(text="NEXUS-7 // STATUS: ONLINE")
+
+    async def health(request):
+        # Liveness: se il loop risponde, il processo è vivo
+        return web.json_response({"status": "ok"})
+
+    async def ready(request):
+        state = readiness()
+        return web.json_response(state, status=200 if state["ready"] else 503)
+
+    async def status(request):
+        state = readiness()
+        state.update({
+            "bot": str(bot.user) if bot.user else None,
+            "guilds": len(bot.guilds),
+            "cogs": sorted(bot.cogs.keys()),
+            "latency_ms": _latency_ms(bot),
+            "uptime_seconds": int((datetime.now() - started_at).total_seconds()),
+            "messages": gatekeeper.stats(),
+        })
+        return web.json_response(state)
+
+    app = web.Application()
+    app.router.add_get("/", home)
+    app.router.add_get("/health", health)
+    app.router.add_get("/ready", ready)
+    app.router.add_get("/status", status)
+    return app
+
+
+async def start_web_server(bot, expected_cogs: int = 0, host: str = WEB_HOST, port: int = WEB_PORT) -> web.AppRunner:
+    """Avvia il web server sul loop corrente e ritorna il runner (da chiudere con cleanup())"""
+    runner = web.AppRunner(create_app(bot, expected_cogs), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    logger.info(f"🌐 Web server attivo su {host}:{port}")
+    return runner
@@ -0,0 +1,126 @@
+"""
+Leaderboard - Classifica degli insegnanti di Noma
+Indice ordinato per punti insegnamento mantenuto in modo incrementale
+(ricerca binaria, niente riordino completo a ogni /teach) e risoluzione
+dei nomi utente con cache: prima user_data, poi la cache di Discord,
+infine fetch_user in parallelo solo per chi manca.
+"""
+
+import asyncio
+import bisect
+import logging
+
+from user_repository import user_repository
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 10
+# Richieste REST contemporanee massime per i nomi mancanti
+MAX_CONCURRENT_FETCHES = 5
+
+
+def teacher_points(profile: dict) -> int:
+    """Punti insegnamento di un profilo (somma dei valori degli insegnamenti)"""
+    return sum(t.get('value', 0) for t in profile.get('teachings', []))
+
+
+class TeacherLeaderboard:
+    """Classifica ordinata per punti con cache dei nomi"""
+
+    def __init__(self):
+        self.points = {}  # user_id -> punti
+        self.ranking = []  # chiavi (-punti, user_id) in ordine crescente
+        self.names = {}  # user_id -> nome visualizzato
+        self.rebuild()
+
+    def rebuild(self):
+        """Ricostruisce l'indice dai profili utente"""
+        self.points = {}
+        for user_id, profile in user_repository.all().items():
+            points = teacher_points(profile)
+            if points > 0:
+                self.points[user_id] = points
+            if profile.get('username'):
+                self.names[user_id] = profile['username']
+        self.ranking = sorted((-points, user_id) for user_id, points in self.points.items())
+
+    def add_points(self, user_id, amount: int, username: str = None):
+        """Aggiunge punti insegnamento a un utente aggiornando la sua posizione"""
+        self.set_points(user_id, self.points.get(str(user_id), 0) + amount, username)
+
+    def set_points(self, user_id, points: int, username: str = None):
+        """Imposta i punti di un utente (O(log n) per la ricerca, O(n) solo per lo spostamento)"""
+        user_id = str(user_id)
+        old = self.points.get(user_id)
+        if old is not None:
+            idx = bisect.bisect_left(self.ranking, (-old, user_id))
+            if idx < len(self.ranking) and self.ranking[idx] == (-old, user_id):
+                del self.ranking[idx]
+        if points > 0:
+            self.points[user_id] = points
+            bisect.insort(self.ranking, (-points, user_id))
+        else:
+            self.points.pop(user_id, None)
+        if username:
+            self.names[user_id] = username
+
+    def rank(self, user_id):
+        """Posizione in classifica (1 = primo), None se l'utente non ha punti"""
+        user_id = str(user_id)
+        points = self.points.get(user_id)
+        if points is None:
+            return None
+        return bisect.bisect_left(self.ranking, (-points, user_id)) + 1
+
+    def page(self, number: int = 1, size: int = PAGE_SIZE) -> list:
+        """Una pagina della classifica: [(posizione, user_id, punti), ...]"""
+        start = max(number - 1, 0) * size
+        return [(start + i + 1, user_id, -neg_points)
+                for i, (neg_points, user_id) in enumerate(self.ranking[start:start + size])]
+
+    def page_count(self, size: int = PAGE_SIZE) -> int:
+        return max((len(self.ranking) + size - 1) // size, 1)
+
+    def __len__(self):
+        return len(self.ranking)
+
+    async def resolve_names(self, bot, user_ids: list) -> dict:
+        """Nomi degli utenti: cache, user_data, cache di Discord, poi fetch in parallelo"""
+        resolved = {}
+        missing = []
+        for user_id in user_ids:
+            user_id = str(user_id)
+            name = self.names.get(user_id) or user_repository.get(user_id).get('username')
+            if not name and bot is not None:
+                user = bot.get_user(int(user_id))
+                name = user.name if user else None
+            if name:
+                self.names[user_id] = name
+                resolved[user_id] = name
+            else:
+                missing.append(user_id)
+
+        if missing and bot is not None:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+            async def fetch(user_id):
+                async with semaphore:
+                    try:
+                        return (await bot.fetch_user(int(user_id))).name
+                    except Exception as e:
+                        logger.debug(f"Utente {user_id} non trovato: {e}")
+                        return None
+
+            names = await asyncio.gather(*(fetch(user_id) for user_id in missing))
+            for user_id, name in zip(missing, names):
+                # Anche i fallimenti restano in cache: niente nuove richieste per utenti spariti
+                self.names[user_id] = name or f"Utente {user_id}"
+                resolved[user_id] = self.names[user_id]
+
+        for user_id in missing:
+            resolved.setdefault(user_id, f"Utente {user_id}")
+        return resolved
+
+
+# Istanza globale della classifica
+teacher_leaderboard = TeacherLeaderboard()
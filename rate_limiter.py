@@ -0,0 +1,151 @@
+"""
+Rate Limiter - Limiti per utente sulle risposte IA
+Ogni utente ha un secchiello di gettoni (burst + ricarica continua): finché
+ha gettoni i suoi messaggi ricevono una risposta da Groq, poi la risposta
+arriva dal fallback locale, senza chiamate all'API.
+
+I messaggi quasi identici vengono riconosciuti con un hash scorrevole
+(Rabin-Karp) sui k-grammi del testo normalizzato: chi continua a ripetere
+lo stesso messaggio riceve solo risposte di fallback e, dopo qualche
+ripetizione, viene silenziato per un po' dal gatekeeper. I messaggi a cui
+risponde il motore locale (saluti, ringraziamenti) passano dal controllo
+delle ripetizioni ma non consumano gettoni.
+"""
+
+import os
+import re
+import time
+import logging
+from collections import deque
+
+from gatekeeper import gatekeeper
+
+logger = logging.getLogger(__name__)
+
+# Configurazione (variabili d'ambiente)
+BURST = int(os.getenv('NEXUS_RATE_BURST', 5))  # Risposte IA consecutive consentite (0 = nessun limite)
+REFILL_PER_SECOND = float(os.getenv('NEXUS_RATE_REFILL', 0.2))  # Gettoni recuperati al secondo
+DUPLICATE_WINDOW = float(os.getenv('NEXUS_DUPLICATE_WINDOW', 120))  # Secondi di memoria dei messaggi
+DUPLICATE_SIMILARITY = 0.8  # Somiglianza (Jaccard) oltre cui due messaggi sono "uguali"
+DUPLICATE_LIMIT = 3  # Ripetizioni nella finestra prima del silenzio
+THROTTLE_SECONDS = float(os.getenv('NEXUS_SPAM_THROTTLE', 60))
+
+SHINGLE_SIZE = 4
+RECENT_MESSAGES = 5
+_HASH_BASE = 257
+_HASH_MOD = (1 << 61) - 1
+_HASH_POW = pow(_HASH_BASE, SHINGLE_SIZE - 1, _HASH_MOD)
+_NORMALIZE = re.compile(r'[\W_]+', re.UNICODE)
+
+# Esiti del controllo
+ALLOW = "allow"
+LIMITED = "limited"
+DUPLICATE = "duplicate"
+LOCAL = "local"  # Risposta locale: nessun gettone consumato
+
+
+def fingerprint(text: str) -> frozenset:
+    """Hash scorrevoli dei k-grammi del testo normalizzato"""
+    normalized = _NORMALIZE.sub(' ', text.lower()).strip()
+    if len(normalized) < SHINGLE_SIZE:
+        return frozenset([hash(normalized)])
+
+    hashes = set()
+    value = 0
+    for ch in normalized[:SHINGLE_SIZE]:
+        value = (value * _HASH_BASE + ord(ch)) % _HASH_MOD
+    hashes.add(value)
+    for i in range(SHINGLE_SIZE, len(normalized)):
+        value = (value - ord(normalized[i - SHINGLE_SIZE]) * _HASH_POW) % _HASH_MOD
+        value = (value * _HASH_BASE + ord(normalized[i])) % _HASH_MOD
+        hashes.add(value)
+    return frozenset(hashes)
+
+
+def similarity(a: frozenset, b: frozenset) -> float:
+    """Indice di Jaccard tra due impronte"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class UserBucket:
+    """Stato di un singolo utente"""
+
+    __slots__ = ("tokens", "updated", "recent", "duplicates")
+
+    def __init__(self, now: float, tokens: float):
+        self.tokens = tokens
+        self.updated = now
+        self.recent = deque(maxlen=RECENT_MESSAGES)  # (istante, impronta)
+        self.duplicates = deque()  # istanti delle ripetizioni
+
+
+class RateLimiter:
+    """Limiti per utente con riconoscimento dello spam ripetuto"""
+
+    def __init__(self, burst: int = BURST, refill_per_second: float = REFILL_PER_SECOND):
+        self.burst = burst
+        self.enabled = burst > 0
+        self.refill_per_second = refill_per_second
+        self.buckets = {}
+        self.counters = {ALLOW: 0, LIMITED: 0, DUPLICATE: 0, LOCAL: 0}
+
+    def _bucket(self, user_id: str, now: float) -> UserBucket:
+        bucket = self.buckets.get(user_id)
+        if bucket is None:
+            bucket = self.buckets[user_id] = UserBucket(now, float(self.burst))
+        return bucket
+
+    def _is_duplicate(self, bucket: UserBucket, current: frozenset, now: float) -> bool:
+        """Confronta con gli ultimi messaggi dell'utente nella finestra"""
+        duplicate = any(
+            now - seen <= DUPLICATE_WINDOW and similarity(current, previous) >= DUPLICATE_SIMILARITY
+            for seen, previous in bucket.recent
+        )
+        bucket.recent.append((now, current))
+        return duplicate
+
+    def check(self, user_id, text: str, local: bool = False) -> str:
+        """Esito per un messaggio: ALLOW (Groq), LIMITED o DUPLICATE (risposta di fallback).
+        Con local=True (risposta senza rete) controlla solo le ripetizioni e ritorna LOCAL."""
+        if not self.enabled:
+            return LOCAL if local else ALLOW
+        user_id = str(user_id)
+        now = time.monotonic()
+        bucket = self._bucket(user_id, now)
+        # Ricarica a ogni messaggio: `updated` è anche l'ultima attività usata da prune()
+        bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.refill_per_second)
+        bucket.updated = now
+
+        if self._is_duplicate(bucket, fingerprint(text), now):
+            bucket.duplicates.append(now)
+            while bucket.duplicates and now - bucket.duplicates[0] > DUPLICATE_WINDOW:
+                bucket.duplicates.popleft()
+            if len(bucket.duplicates) >= DUPLICATE_LIMIT:
+                bucket.duplicates.clear()
+                gatekeeper.throttle(user_id, THROTTLE_SECONDS)
+            self.counters[DUPLICATE] += 1
+            return DUPLICATE
+
+        if local:
+            self.counters[LOCAL] += 1
+            return LOCAL
+
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            self.counters[ALLOW] += 1
+            return ALLOW
+
+        self.counters[LIMITED] += 1
+        return LIMITED
+
+    def prune(self, idle_seconds: float = 3600):
+        """Dimentica gli utenti inattivi da più di idle_seconds"""
+        now = time.monotonic()
+        for user_id in [uid for uid, b in self.buckets.items() if now - b.updated > idle_seconds]:
+            del self.buckets[user_id]
+
+
+# Istanza globale dei limiti
+rate_limiter = RateLimiter()
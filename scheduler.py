@@ -0,0 +1,231 @@
+"""
+Scheduler - Pianificatore unico dei lavori in background
+Un solo task asincrono con un heap dei lavori in scadenza: dorme fino al
+prossimo evento invece di controllare a intervalli fissi. Gli orari
+giornalieri sono allineati all'orologio di Firenze (Europe/Rome), i
+prossimi orari vengono salvati su file per sopravvivere ai riavvii e un
+jitter opzionale evita che tutto scatti allo stesso secondo.
+
+Tipi di lavoro:
+- interval=N          ogni N secondi
+- hour=H, minute=M    ogni giorno alle H:M (H può essere una funzione)
+- minute=M            ogni ora al minuto M
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import random
+import logging
+from datetime import datetime, timedelta, time as dtime
+from pathlib import Path
+
+from storage import load_data, save_data
+from clock import clock, FIRENZE_TZ
+
+logger = logging.getLogger(__name__)
+DATA_DIR = Path(os.getenv('NEXUS_DATA_DIR', Path(__file__).parent / "data"))
+
+# Sonno massimo tra due controlli (protegge da salti dell'orologio di sistema)
+MAX_SLEEP = 3600
+
+
+class Job:
+    """Un lavoro pianificato"""
+
+    def __init__(self, name, callback, interval=None, hour=None, minute=None,
+                 jitter=0.0, grace=0.0, persist=True, owner=None):
+        if interval is None and minute is None:
+            raise ValueError(f"Il lavoro '{name}' richiede interval oppure minute")
+        self.name = name
+        self.callback = callback
+        self.interval = interval
+        self.hour = hour
+        self.minute = minute
+        self.jitter = jitter
+        self.grace = grace  # Secondi entro cui un'esecuzione persa al riavvio viene recuperata
+        self.persist = persist
+        self.owner = owner
+        self.next_run = None
+        self.task = None
+
+    def compute_next(self, after: float) -> float:
+        """Prossima esecuzione (timestamp) strettamente dopo `after`"""
+        if self.interval is not None:
+            base = after + self.interval
+        elif self.hour is None:
+            # Ogni ora al minuto indicato (i fusi di Europe/Rome sono a ore intere)
+            base = (after // 3600) * 3600 + self.minute * 60
+            if base <= after:
+                base += 3600
+        else:
+            hour = self.hour() if callable(self.hour) else self.hour
+            day = datetime.fromtimestamp(after, FIRENZE_TZ).date()
+            target = datetime.combine(day, dtime(hour, self.minute or 0), tzinfo=FIRENZE_TZ)
+            if target.timestamp() <= after:
+                target = datetime.combine(day + timedelta(days=1), dtime(hour, self.minute or 0), tzinfo=FIRENZE_TZ)
+            base = target.timestamp()
+        return base + (random.uniform(0, self.jitter) if self.jitter else 0)
+
+
+class Scheduler:
+    """Heap di lavori in scadenza servito da un unico task"""
+
+    def __init__(self):
+        self.state_file = DATA_DIR / "scheduler_state.json"
+        self.saved_runs = self._load_state()
+        self.jobs = {}
+        self.heap = []
+        self._counter = itertools.count()
+        self._wakeup = None
+        self._runner = None
+
+    def _load_state(self) -> dict:
+        """Prossime esecuzioni salvate (nome -> timestamp)"""
+        if self.state_file.exists():
+            try:
+                return load_data(self.state_file)
+            except:
+                pass
+        return {}
+
+    def _save_state(self):
+        state = {name: job.next_run for name, job in self.jobs.items() if job.persist and job.next_run}
+        # Mantieni gli orari dei lavori non ancora registrati (cog non caricati)
+        for name, next_run in self.saved_runs.items():
+            if name not in self.jobs:
+                state[name] = next_run
+        try:
+            save_data(self.state_file, state)
+        except Exception as e:
+            logger.error(f"Errore salvataggio scheduler: {e}")
+
+    def add_job(self, name: str, callback, **options) -> Job:
+        """Registra un lavoro (callback asincrona senza argomenti)"""
+        job = Job(name, callback, **options)
+        now = clock.time()
+        saved = self.saved_runs.get(name) if job.persist else None
+
+        if saved and saved > now:
+            next_run = saved
+        elif saved and now - saved <= job.grace:
+            next_run = now  # Esecuzione persa durante un riavvio: recuperala subito
+        else:
+            next_run = job.compute_next(now)
+
+        self.remove_job(name)
+        self.jobs[name] = job
+        self._push(job, next_run)
+        if job.persist:
+            self._save_state()
+        self._ensure_running()
+        return job
+
+    def remove_job(self, name: str):
+        """Rimuove un lavoro e ferma l'eventuale esecuzione in corso"""
+        job = self.jobs.pop(name, None)
+        if job is None:
+            return
+        if job.persist and job.next_run:
+            self.saved_runs[name] = job.next_run
+        if job.task and not job.task.done():
+            job.task.cancel()
+        # La voce nell'heap resta e viene scartata quando arriva in cima
+        if self._wakeup:
+            self._wakeup.set()
+
+    def remove_owner(self, owner):
+        """Rimuove tutti i lavori registrati da un cog"""
+        for name in [name for name, job in self.jobs.items() if job.owner == owner]:
+            self.remove_job(name)
+        self._save_state()
+
+    def reschedule(self, name: str):
+        """Ricalcola la prossima esecuzione (es. dopo un cambio dell'ora di un lavoro giornaliero)"""
+        job = self.jobs.get(name)
+        if job is None:
+            return
+        self._push(job, job.compute_next(clock.time()))
+        if job.persist:
+            self._save_state()
+
+    def next_run(self, name: str):
+        job = self.jobs.get(name)
+        return job.next_run if job else None
+
+    def _push(self, job: Job, next_run: float):
+        job.next_run = next_run
+        heapq.heappush(self.heap, (next_run, next(self._counter), job))
+        if self._wakeup:
+            self._wakeup.set()
+
+    def _ensure_running(self):
+        if self._runner and not self._runner.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("⚠️ Scheduler senza event loop: partirà al prossimo lavoro registrato")
+            return
+        self._wakeup = asyncio.Event()
+        self._runner = loop.create_task(self._run())
+
+    async def _run(self):
+        """Dorme fino al prossimo lavoro in scadenza e lo esegue"""
+        while self.jobs:
+            if not self.heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            next_run, _, job = self.heap[0]
+            if self.jobs.get(job.name) is not job or job.next_run != next_run:
+                heapq.heappop(self.heap)  # Voce obsoleta (lavoro rimosso o ripianificato)
+                continue
+
+            delay = next_run - clock.time()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=min(delay, MAX_SLEEP))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self.heap)
+            self._fire(job)
+            self._push(job, job.compute_next(max(clock.time(), next_run)))
+            if job.persist:
+                self._save_state()
+
+    def _fire(self, job: Job):
+        if job.task and not job.task.done():
+            logger.warning(f"⏭️ {job.name} ancora in esecuzione, salto questo giro")
+            return
+        job.task = asyncio.get_running_loop().create_task(self._execute(job))
+
+    async def _execute(self, job: Job):
+        try:
+            await job.callback()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Errore nel lavoro pianificato {job.name}: {e}")
+
+    async def stop(self):
+        """Ferma lo scheduler e tutti i lavori in corso"""
+        for name in list(self.jobs):
+            self.remove_job(name)
+        self._save_state()
+        if self._runner and not self._runner.done():
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+        self._runner = None
+
+
+# Istanza globale condivisa dai cog
+scheduler = Scheduler()
@@ -0,0 +1,148 @@
+"""
+Startup Profiler - Dove se ne va il tempo all'avvio
+Attivo con `python main.py --profile-startup`: misura il tempo di import di
+ogni modulo, il caricamento di ogni cog, la lettura di ogni file dati e i
+momenti chiave (cog caricati, on_ready, sync dei comandi), poi stampa una
+classifica. Serve a tenere sotto controllo gli avvii a freddo su Render.
+
+Va installato prima di qualsiasi altro import, altrimenti i moduli già
+caricati non vengono misurati.
+"""
+
+import sys
+import time
+import builtins
+import importlib.util
+from collections import defaultdict
+from pathlib import Path
+
+TOP = 15  # Righe per classifica
+
+
+class StartupProfiler:
+    """Raccoglie i tempi dell'avvio e stampa il report"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.imports = {}  # modulo -> (cumulativo, proprio) in secondi
+        self.cogs = {}  # cog -> secondi
+        self.data_files = {}  # file -> (secondi, byte)
+        self.milestones = []  # (momento, secondi dall'avvio)
+        self.active = False
+        self.reported = False
+        self._stack = []  # [tempo dei figli] per ogni import in corso
+        self._original_import = None
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # RACCOLTA
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def install(self):
+        """Inizia a misurare import e letture dei file dati"""
+        if self.active:
+            return
+        self.active = True
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+        import storage
+        storage.load_observer = self.record_data_file
+
+    def uninstall(self):
+        """Smette di misurare (niente costi dopo l'avvio)"""
+        if not self.active:
+            return
+        self.active = False
+        builtins.__import__ = self._original_import
+        import storage
+        storage.load_observer = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level:
+            package = (globals or {}).get('__package__') or ''
+            try:
+                name_key = importlib.util.resolve_name('.' * level + name, package)
+            except ImportError:
+                name_key = name
+        else:
+            name_key = name
+        # Moduli già caricati: nessun costo da misurare (tranne i sotto-moduli chiesti da "from x import y")
+        if name_key in sys.modules and not any(
+                f"{name_key}.{item}" not in sys.modules and not hasattr(sys.modules[name_key], item)
+                for item in fromlist or ()):
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += total
+            previous_total, previous_self = self.imports.get(name_key, (0.0, 0.0))
+            self.imports[name_key] = (previous_total + total, previous_self + total - children)
+
+    def record_cog(self, name: str, seconds: float):
+        self.cogs[name] = seconds
+
+    def record_data_file(self, path, seconds: float, size: int):
+        path = Path(path)
+        name = f"{path.parent.name}/{path.name}" if path.parent.name != "data" else path.name
+        previous_seconds, _ = self.data_files.get(name, (0.0, 0))
+        self.data_files[name] = (previous_seconds + seconds, size)
+
+    def mark(self, name: str):
+        """Registra un momento dell'avvio (secondi dall'avvio del processo)"""
+        self.milestones.append((name, time.perf_counter() - self.started))
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # REPORT
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def report(self) -> str:
+        """Classifica dei tempi raccolti"""
+        lines = ["", "⏱️ Profilo di avvio", "━" * 72]
+
+        packages = defaultdict(float)
+        for name, (_, own) in self.imports.items():
+            packages[name.split('.')[0]] += own
+        lines.append(f"\n  Import per pacchetto (tempo proprio, totale {sum(packages.values()) * 1000:.0f} ms):")
+        for name, seconds in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:TOP]:
+            lines.append(f"    {name:<48} {seconds * 1000:9.1f} ms")
+
+        lines.append("\n  Import più lenti (cumulativo, con i sotto-moduli):")
+        for name, (total, _) in sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)[:TOP]:
+            lines.append(f"    {name:<48} {total * 1000:9.1f} ms")
+
+        if self.cogs:
+            lines.append(f"\n  Cog (totale {sum(self.cogs.values()) * 1000:.0f} ms):")
+            for name, seconds in sorted(self.cogs.items(), key=lambda item: item[1], reverse=True):
+                lines.append(f"    {name:<48} {seconds * 1000:9.1f} ms")
+
+        if self.data_files:
+            lines.append(f"\n  File dati letti (totale {sum(s for s, _ in self.data_files.values()) * 1000:.0f} ms):")
+            ranked = sorted(self.data_files.items(), key=lambda item: item[1][0], reverse=True)
+            for name, (seconds, size) in ranked[:TOP]:
+                lines.append(f"    {name:<36} {size / 1024:9.1f} KiB {seconds * 1000:9.1f} ms")
+
+        if self.milestones:
+            lines.append("\n  Momenti dell'avvio (dall'avvio del processo):")
+            for name, seconds in self.milestones:
+                lines.append(f"    {name:<48} {seconds:9.2f} s")
+
+        lines.append("")
+        return "\n".join(lines)
+
+    def finish(self):
+        """Chiude la misura e stampa il report (una volta sola)"""
+        if self.reported:
+            return
+        self.reported = True
+        self.uninstall()
+        print(self.report(), flush=True)
+
+
+# Istanza globale del profiler (inattiva finché non viene installata)
+startup_profiler = StartupProfiler()
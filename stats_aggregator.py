@@ -0,0 +1,94 @@
+"""
+Stats Aggregator - Contatori globali di Noma
+Totali di insegnamenti, sfide, regali e messaggi aggiornati a ogni evento,
+così /nexus_status, /crescita e il pannello del creatore rispondono in tempo
+costante senza scorrere i profili di tutti gli utenti.
+
+Se aggregate_stats.json non esiste i contatori vengono ricostruiti una volta
+dai dati esistenti.
+"""
+
+import os
+import logging
+from datetime import datetime
+from pathlib import Path
+
+from storage import load_data, save_data
+from user_repository import user_repository
+from noma_relationships import noma_relationships
+from gift_ledger import RECEIVED, GIVEN
+
+logger = logging.getLogger(__name__)
+DATA_DIR = Path(os.getenv('NEXUS_DATA_DIR', Path(__file__).parent / "data"))
+
+COUNTERS = ("teachings", "challenges", "gifts_received", "gifts_given", "messages")
+
+
+class StatsAggregator:
+    """Contatori O(1) persistiti su file"""
+
+    def __init__(self):
+        self.stats_file = DATA_DIR / "aggregate_stats.json"
+        self.counters = self._load_counters()
+        self.dirty = False
+
+    def _load_counters(self) -> dict:
+        """Carica i contatori, ricostruendoli se il file manca o è illeggibile"""
+        if self.stats_file.exists():
+            try:
+                loaded = load_data(self.stats_file)
+                return {name: int(loaded.get(name, 0)) for name in COUNTERS}
+            except:
+                logger.warning("⚠️ aggregate_stats.json illeggibile, ricostruisco i contatori")
+
+        counters = self._count_from_data()
+        self._write(counters)
+        return counters
+
+    def _count_from_data(self) -> dict:
+        """Conta tutto dai dati sorgente (una sola volta, all'avvio)"""
+        users = user_repository.all().values()
+        return {
+            "teachings": sum(len(u.get('teachings', [])) for u in users),
+            "challenges": sum(len(u.get('challenges', [])) for u in users),
+            "gifts_received": noma_relationships.gifts.count(RECEIVED),
+            "gifts_given": noma_relationships.gifts.count(GIVEN),
+            "messages": sum(u.get('messages', 0) for u in users),
+        }
+
+    def rebuild(self):
+        """Riallinea i contatori ai dati sorgente"""
+        self.counters = self._count_from_data()
+        self.save()
+
+    def _write(self, counters: dict):
+        try:
+            save_data(self.stats_file, dict(counters, updated_at=datetime.now().isoformat()))
+        except Exception as e:
+            logger.error(f"Errore salvataggio aggregate_stats: {e}")
+
+    def record(self, name: str, amount: int = 1, persist: bool = True):
+        """Registra un evento. Con persist=False il salvataggio avviene al prossimo flush"""
+        self.counters[name] = self.counters.get(name, 0) + amount
+        if persist:
+            self.save()
+        else:
+            self.dirty = True
+
+    def get(self, name: str) -> int:
+        """Valore attuale di un contatore"""
+        return self.counters.get(name, 0)
+
+    def save(self):
+        """Salva subito i contatori"""
+        self._write(self.counters)
+        self.dirty = False
+
+    def flush(self):
+        """Salva solo se ci sono eventi non ancora persistiti"""
+        if self.dirty:
+            self.save()
+
+
+# Istanza globale dei contatori
+noma_stats = StatsAggregator()
@@ -0,0 +1,129 @@
+"""
+Storage Codecs - Serializzazione dei file dati
+Formato di salvataggio configurabile (JSON leggibile in sviluppo, compatto,
+orjson o msgpack in produzione) con riconoscimento automatico al caricamento:
+i file scritti in un formato qualsiasi restano leggibili dopo un cambio.
+
+Formato scelto con NEXUS_STORAGE_FORMAT = pretty | compact | orjson | msgpack
+"""
+
+import json
+import os
+import time
+import logging
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+# Primo byte significativo di un documento JSON (i nostri file sono oggetti o liste)
+_JSON_START = frozenset(b'{["-0123456789tfn')
+_WHITESPACE = b' \t\r\n'
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+# Chiamata dopo ogni load_data con (percorso, secondi, byte): usata dal profiler di avvio
+load_observer = None
+
+
+def _encode_pretty(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _encode_compact(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _encode_orjson(data: Any) -> bytes:
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _encode_msgpack(data: Any) -> bytes:
+    return msgpack.packb(data, use_bin_type=True)
+
+
+CODECS = {
+    "pretty": _encode_pretty,
+    "compact": _encode_compact,
+    "orjson": _encode_orjson,
+    "msgpack": _encode_msgpack,
+}
+
+
+def _resolve_format(name: str) -> str:
+    """Valida il formato richiesto, ripiegando su JSON se manca la libreria"""
+    name = (name or "pretty").strip().lower()
+    if name not in CODECS:
+        logger.warning(f"⚠️ Formato di storage sconosciuto '{name}', uso 'pretty'")
+        return "pretty"
+    if name == "orjson" and orjson is None:
+        logger.warning("⚠️ orjson non installato, uso 'compact'")
+        return "compact"
+    if name == "msgpack" and msgpack is None:
+        logger.warning("⚠️ msgpack non installato, uso 'compact'")
+        return "compact"
+    return name
+
+
+STORAGE_FORMAT = _resolve_format(os.getenv('NEXUS_STORAGE_FORMAT', 'pretty'))
+
+
+def encode(data: Any, fmt: str = None) -> bytes:
+    """Serializza nel formato configurato (o in quello indicato)"""
+    return CODECS[_resolve_format(fmt) if fmt else STORAGE_FORMAT](data)
+
+
+def detect_format(raw: bytes) -> str:
+    """Riconosce il formato di un contenuto: 'json' o 'msgpack'"""
+    stripped = raw[len(_UTF8_BOM):] if raw.startswith(_UTF8_BOM) else raw
+    stripped = stripped.lstrip(_WHITESPACE)
+    if not stripped or stripped[0] in _JSON_START:
+        return "json"
+    return "msgpack"
+
+
+def decode(raw: bytes) -> Any:
+    """Deserializza riconoscendo automaticamente il formato"""
+    if raw.startswith(_UTF8_BOM):
+        raw = raw[len(_UTF8_BOM):]
+    if detect_format(raw) == "msgpack":
+        if msgpack is None:
+            raise ValueError("File in formato msgpack ma msgpack non è installato")
+        return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def load_data(path: Path) -> Any:
+    """Carica un file dati in qualsiasi formato supportato"""
+    if load_observer is None:
+        with open(path, 'rb') as f:
+            return decode(f.read())
+
+    start = time.perf_counter()
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = decode(raw)
+    load_observer(path, time.perf_counter() - start, len(raw))
+    return data
+
+
+def save_data(path: Path, data: Any, fmt: str = None) -> int:
+    """Salva un file dati in modo atomico (file temporaneo + rename). Ritorna i byte scritti"""
+    path = Path(path)
+    payload = encode(data, fmt)
+    temp_file = path.with_name(path.name + '.tmp')
+    with open(temp_file, 'wb') as f:
+        f.write(payload)
+    os.replace(temp_file, path)
+    return len(payload)
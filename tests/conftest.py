@@ -0,0 +1,14 @@
+"""
+Configurazione comune dei test
+I moduli leggono NEXUS_DATA_DIR all'import: va impostata prima che i test
+importino qualsiasi cosa dal repo, così i file dati finiscono in una cartella
+temporanea e non in data/.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+os.environ["NEXUS_DATA_DIR"] = tempfile.mkdtemp(prefix="nexus-tests-")
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,48 @@
+"""Test dell'orologio di Firenze condiviso"""
+
+from datetime import date, datetime, timezone
+
+from clock import Clock
+
+
+def _utc(*args) -> float:
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+def test_local_time_follows_the_rome_offset():
+    now = [_utc(2025, 1, 15, 22, 30)]
+    clock = Clock(source=lambda: now[0])
+    assert (clock.hour(), clock.today_iso()) == (23, "2025-01-15")
+    now[0] = _utc(2025, 7, 15, 22, 30)  # estate: UTC+2, già domani
+    assert (clock.hour(), clock.today(), clock.season()) == (0, date(2025, 7, 16), "estate")
+
+
+def test_dst_switch_days():
+    now = [_utc(2025, 3, 30, 0, 59)]
+    clock = Clock(source=lambda: now[0])
+    assert clock.hour() == 1
+    now[0] = _utc(2025, 3, 30, 1, 0)
+    assert clock.hour() == 3
+    now[0] = _utc(2025, 10, 26, 0, 30)
+    assert clock.local().fold == 0 and clock.hour() == 2
+    now[0] = _utc(2025, 10, 26, 1, 30)
+    assert clock.hour() == 2 and clock.local().utcoffset().total_seconds() == 3600
+
+
+def test_local_is_cached_per_minute():
+    now = [_utc(2025, 12, 31, 22, 59, 10)]
+    clock = Clock(source=lambda: now[0])
+    first = clock.local()
+    now[0] += 30
+    assert clock.local() is first
+    assert clock.season() == "inverno"
+    now[0] += 30  # mezzanotte a Firenze: nuovo anno
+    assert clock.today_iso() == "2026-01-01"
+    assert clock.now().second == 10
+
+
+def test_set_source_switches_back_to_system_time():
+    clock = Clock(source=lambda: 0.0)
+    assert clock.time() == 0.0
+    clock.set_source()
+    assert clock.time() > _utc(2024, 1, 1)
@@ -0,0 +1,106 @@
+"""Test della sincronizzazione dei comandi solo quando cambiano"""
+
+import asyncio
+
+import discord
+import pytest
+from discord import app_commands
+
+import command_sync
+from benchmarks.fakes import FakeBot
+from command_sync import fingerprint, sync_command_tree
+
+
+def _command(name: str, description: str = "descrizione"):
+    async def callback(interaction: discord.Interaction):
+        pass
+    return app_commands.Command(name=name, description=description, callback=callback)
+
+
+@pytest.fixture
+def state_file(tmp_path, monkeypatch):
+    path = tmp_path / "command_tree.json"
+    monkeypatch.setattr(command_sync, "STATE_FILE", path)
+    return path
+
+
+def _run(setup, *calls):
+    """Crea un bot con i comandi di setup e fa i sync richiesti; ritorna le chiamate a tree.sync"""
+    synced = []
+
+    async def run():
+        async with FakeBot() as bot:
+            async def fake_sync(*, guild=None):
+                synced.append(guild.id if guild else None)
+                return bot.tree.get_commands(guild=guild)
+
+            bot.tree.sync = fake_sync
+            setup(bot.tree)
+            return [await sync_command_tree(bot, **options) for options in calls]
+
+    return asyncio.run(run()), synced
+
+
+def test_fingerprint_ignores_registration_order():
+    def build(names):
+        tree = app_commands.CommandTree(discord.Client(intents=discord.Intents.none()))
+        for name in names:
+            tree.add_command(_command(name))
+        return fingerprint(tree)
+
+    assert build(["ciao", "diario", "regalo"]) == build(["regalo", "ciao", "diario"])
+    assert build(["ciao", "diario"]) != build(["ciao", "diario", "regalo"])
+
+
+def test_fingerprint_changes_with_the_definition():
+    def build(description):
+        tree = app_commands.CommandTree(discord.Client(intents=discord.Intents.none()))
+        tree.add_command(_command("ciao", description))
+        return fingerprint(tree)
+
+    assert build("saluta") != build("saluta Noma")
+
+
+def test_unchanged_tree_is_not_synced_again(state_file):
+    setup = lambda tree: tree.add_command(_command("ciao"))
+    results, synced = _run(setup, {"guild_id": 0, "force": False}, {"guild_id": 0, "force": False})
+    assert synced == [None]
+    assert results[1] is None
+    assert state_file.exists()
+
+    _, synced = _run(setup, {"guild_id": 0, "force": False}, {"guild_id": 0, "force": True})
+    assert synced == [None]
+
+
+def test_changed_tree_or_new_guild_is_synced(state_file):
+    _run(lambda tree: tree.add_command(_command("ciao")), {"guild_id": 0, "force": False})
+
+    def two_commands(tree):
+        tree.add_command(_command("ciao"))
+        tree.add_command(_command("diario"))
+
+    results, synced = _run(two_commands, {"guild_id": 0, "force": False}, {"guild_id": 1234, "force": False},
+                           {"guild_id": 1234, "force": False})
+    assert synced == [None, 1234]
+    assert len(results[1]) == 2  # copiati dai comandi globali
+
+
+def test_failed_sync_is_retried(state_file):
+    async def run():
+        async with FakeBot() as bot:
+            bot.tree.add_command(_command("ciao"))
+
+            async def failing_sync(*, guild=None):
+                raise discord.HTTPException(_Response(), "errore")
+
+            bot.tree.sync = failing_sync
+            with pytest.raises(discord.HTTPException):
+                await sync_command_tree(bot, guild_id=0, force=False)
+
+    asyncio.run(run())
+    assert not state_file.exists()
+
+
+class _Response:
+    status = 500
+    reason = "Internal Server Error"
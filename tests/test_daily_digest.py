@@ -0,0 +1,84 @@
+"""Test dei secchielli giornalieri di eventi"""
+
+from datetime import datetime
+
+import pytest
+
+import daily_digest as digest_module
+from clock import FIRENZE_TZ, clock
+from daily_digest import DailyDigest
+from storage import load_data, save_data
+
+
+@pytest.fixture
+def day(tmp_path, monkeypatch):
+    """Sposta l'orologio condiviso su un giorno di Firenze"""
+    monkeypatch.setattr(digest_module, "DATA_DIR", tmp_path)
+
+    def move_to(month, day_of_month, hour=12):
+        moment = datetime(2025, month, day_of_month, hour, tzinfo=FIRENZE_TZ).timestamp()
+        clock.set_source(lambda: moment)
+
+    move_to(3, 24)
+    yield move_to
+    clock.set_source()
+
+
+def test_entry_is_built_from_todays_events(day):
+    digest = DailyDigest()
+    digest.record_teaching("alba", "le stelle sono soli lontani")
+    digest.record_concept("stelle")
+    digest.record_concept("stelle")
+    digest.record_gift("bruno", "fiore")
+    digest.record_mood("Felice 💕", "regalo")
+
+    entry = digest.build_entry()
+    assert entry["learned"] == ["le stelle sono soli lontani", "stelle"]
+    assert entry["counts"] == {"teachings": 1, "concepts": 1, "gifts": 1, "moods": 1}
+    assert "Amata per i regali ricevuti" in entry["feelings"]
+    assert "Mi sono sentita felice 💕" in entry["feelings"]
+    assert "bruno mi ha regalato fiore" in entry["special_moments"]
+
+
+def test_days_follow_florence_midnight(day):
+    digest = DailyDigest()
+    day(3, 24, hour=23)
+    digest.record_concept("sera")
+    day(3, 25, hour=0)
+    digest.record_concept("sera")
+    assert digest.get_day("2025-03-24")["concepts"] == ["sera"]
+    assert digest.build_entry()["learned"] == ["sera"]
+
+
+def test_only_recent_days_are_kept(day):
+    digest = DailyDigest()
+    for n in range(24, 29):
+        day(3, n)
+        digest.record_concept(f"giorno {n}")
+    assert sorted(digest.days) == ["2025-03-26", "2025-03-27", "2025-03-28"]
+    assert sorted(digest.seen_concepts) == sorted(digest.days)
+
+
+def test_seen_concepts_survive_a_restart_past_the_example_cap(day, monkeypatch):
+    monkeypatch.setattr(digest_module, "MAX_EVENTS", 3)
+    digest = DailyDigest()
+    for n in range(5):
+        digest.record_concept(f"concetto {n}")
+    digest.flush()
+
+    restarted = DailyDigest()
+    restarted.record_concept("concetto 4")
+    restarted.record_concept("concetto 5")
+    assert restarted.get_day()["counts"]["concepts"] == 6
+    assert restarted.get_day()["concepts"] == ["concetto 0", "concetto 1", "concetto 2"]
+
+
+def test_old_files_without_seen_concepts_still_load(day, tmp_path):
+    bucket = {"teachings": [], "concepts": ["vecchio"], "gifts": [], "moods": [],
+              "counts": {"teachings": 0, "concepts": 1, "gifts": 0, "moods": 0}}
+    save_data(tmp_path / "daily_digest.json", {"2025-03-24": bucket})
+    digest = DailyDigest()
+    digest.record_concept("vecchio")
+    assert digest.get_day()["counts"]["concepts"] == 1
+    digest.save()
+    assert load_data(tmp_path / "daily_digest.json")["2025-03-24"]["seen_concepts"] == ["vecchio"]
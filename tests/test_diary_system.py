@@ -0,0 +1,138 @@
+"""Test del diario a righe: indice, ricostruzione, ricerca e periodi"""
+
+import json
+from datetime import date, datetime
+
+import pytest
+
+import diary_system
+from clock import FIRENZE_TZ, clock
+from diary_system import INDEX_RECORD, NomaDiary
+from storage import save_data
+
+DAYS = [date(2025, 3, 1), date(2025, 3, 15), date(2025, 3, 15), date(2025, 4, 2), date(2025, 5, 20)]
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(diary_system, "DATA_DIR", tmp_path)
+    yield tmp_path
+    clock.set_source()
+
+
+def _write_pages(days=DAYS) -> NomaDiary:
+    diary = NomaDiary()
+    for n, day in enumerate(days):
+        moment = datetime(day.year, day.month, day.day, 21, 0, tzinfo=FIRENZE_TZ).timestamp()
+        clock.set_source(lambda moment=moment: moment)
+        diary.write_daily_entry([f"lezione {n}", "stelle cadenti" if n % 2 else "mare"], ["felice"],
+                                [f"momento {n}"])
+    clock.set_source()
+    return diary
+
+
+def _pages(diary) -> list:
+    return [diary.get_entry(n)["learned"][0] for n in range(1, diary.count() + 1)]
+
+
+def test_index_reads_pages_by_number_and_date(data_dir):
+    _write_pages()
+    diary = NomaDiary()
+    assert diary.count() == 5
+    assert diary.get_entry(4)["learned"][0] == "lezione 3"
+    assert diary.get_entry(0) is None and diary.get_entry(6) is None
+    assert [e["learned"][0] for e in diary.get_entries_by_date(date(2025, 3, 15))] == ["lezione 1", "lezione 2"]
+    assert diary.get_entries_by_date(date(2025, 3, 2)) == []
+    assert [e["learned"][0] for e in diary.get_recent_entries(2)] == ["lezione 3", "lezione 4"]
+    assert diary.get_stats()["total_days_awake"] == 5
+
+
+def test_missing_index_is_rebuilt(data_dir):
+    expected = _pages(_write_pages())
+    (data_dir / "noma_diary.idx").unlink()
+    diary = NomaDiary()
+    assert _pages(diary) == expected
+    assert (data_dir / "noma_diary.idx").stat().st_size == 5 * INDEX_RECORD.size
+    assert diary.get_stats()["learned_total"] == 10
+
+
+def test_stale_index_is_rebuilt_when_the_diary_grew(data_dir):
+    _write_pages()
+    page = {"date": "2025-06-01T21:00:00+02:00", "learned": ["aggiunta a mano"], "feelings": [], "special_moments": []}
+    with open(data_dir / "noma_diary.jsonl", "ab") as f:
+        f.write((json.dumps(page) + "\n").encode("utf-8"))
+
+    diary = NomaDiary()
+    assert diary.count() == 6
+    assert diary.get_entry(6)["learned"] == ["aggiunta a mano"]
+    assert [e["learned"] for e in diary.get_entries_by_date(date(2025, 6, 1))] == [["aggiunta a mano"]]
+
+
+def test_index_pointing_past_the_diary_is_rebuilt(data_dir):
+    expected = _pages(_write_pages())
+    with open(data_dir / "noma_diary.idx", "ab") as f:
+        f.write(INDEX_RECORD.pack(10 ** 9, date(2025, 6, 1).toordinal()))
+    assert _pages(NomaDiary()) == expected
+
+
+def test_truncated_index_record_is_ignored(data_dir):
+    expected = _pages(_write_pages())
+    with open(data_dir / "noma_diary.idx", "ab") as f:
+        f.write(b"\x01\x02\x03")
+    assert _pages(NomaDiary()) == expected
+
+
+def test_legacy_json_diary_is_migrated(data_dir):
+    entries = [{"date": f"2025-01-0{n}T20:00:00", "learned": [f"vecchia {n}"], "feelings": [], "special_moments": []}
+               for n in range(1, 4)]
+    save_data(data_dir / "noma_diary.json", {"entries": entries})
+    diary = NomaDiary()
+    assert _pages(diary) == ["vecchia 1", "vecchia 2", "vecchia 3"]
+    assert (data_dir / "noma_diary.json.migrated").exists()
+    assert not (data_dir / "noma_diary.json").exists()
+
+
+TODAY = date(2025, 4, 10)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2025-03-15", (date(2025, 3, 15), date(2025, 3, 15))),
+    ("15/03/2025", (date(2025, 3, 15), date(2025, 3, 15))),
+    ("marzo", (date(2025, 3, 1), date(2025, 3, 31))),
+    ("Maggio", (date(2024, 5, 1), date(2024, 5, 31))),  # maggio non è ancora arrivato: l'anno scorso
+    ("febbraio 2024", (date(2024, 2, 1), date(2024, 2, 29))),
+    ("03/2025", (date(2025, 3, 1), date(2025, 3, 31))),
+    ("2025", (date(2025, 1, 1), date(2025, 12, 31))),
+    ("marzo-aprile", (date(2025, 3, 1), date(2025, 4, 30))),
+    ("01/03/2025 - 15/04/2025", (date(2025, 3, 1), date(2025, 4, 15))),
+    ("2025-03-01 - 2025-04-15", (date(2025, 3, 1), date(2025, 4, 15))),
+    (" 2025-03-01 - aprile 2025 ", (date(2025, 3, 1), date(2025, 4, 30))),
+])
+def test_parse_period(text, expected):
+    assert diary_system.parse_period(text, TODAY) == expected
+
+
+@pytest.mark.parametrize("text", ["", "ieri", "2025-13-01", "31/02/2025", "2025-03-01-2025-04-15", "marzo - boh"])
+def test_parse_period_rejects_invalid_text(text):
+    assert diary_system.parse_period(text, TODAY) is None
+
+
+def test_search_by_keywords_and_period(data_dir):
+    _write_pages()
+    diary = NomaDiary()
+    assert diary.search("stelle cadenti") == [3, 1]
+    assert diary.search("stelle", *diary_system.parse_period("2025-03-01 - 2025-03-31", TODAY)) == [1]
+    assert diary.search("", *diary_system.parse_period("marzo", TODAY)) == [2, 1, 0]
+    assert diary.search("momento mare") == [4, 2, 0]
+    assert diary.search("parola assente") == []
+    assert [number for number, _ in diary.get_entries_at([3, 1])] == [4, 2]
+
+
+def test_word_index_is_saved_and_extended_with_new_pages(data_dir):
+    _write_pages(DAYS[:3])
+    assert NomaDiary().search("stelle") == [1]
+    assert (data_dir / "noma_diary_terms.json").exists()
+
+    diary = _write_pages(DAYS[3:])  # due pagine scritte senza toccare l'indice delle parole
+    assert NomaDiary().search("stelle") == [4, 1]
+    assert diary.search("lezione") == [4, 3, 2, 1, 0]
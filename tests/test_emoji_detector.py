@@ -0,0 +1,45 @@
+"""Test del riconoscimento degli emoji"""
+
+import pytest
+
+from emoji_detector import emoji_argument, find_emojis, first_emoji, is_emoji, normalize
+
+
+@pytest.mark.parametrize("emoji", [
+    "🇮🇹",  # bandiera
+    "1️⃣",  # tasto
+    "👁️",  # selettore di variante
+    "👋🏽",  # tono della pelle
+    "👩‍💻",  # sequenza ZWJ
+    "❤️",  # simbolo testuale con U+FE0F
+    "✌🏻",  # simbolo testuale con tono della pelle
+])
+def test_clusters_stay_whole(emoji):
+    assert find_emojis(f"prima {emoji} dopo") == [emoji]
+    assert is_emoji(emoji)
+
+
+@pytest.mark.parametrize("text", ["ok ✓", "★★★", "☐ da fare", "❤ senza selettore", "ciao!", ""])
+def test_symbols_and_text_are_not_emoji(text):
+    assert find_emojis(text) == []
+    assert first_emoji(text) is None
+
+
+def test_normalize_ignores_variation_selectors():
+    assert normalize(" 👁️ ") == normalize("👁")
+
+
+@pytest.mark.parametrize("argument, expected", [
+    ("😊", "😊"),
+    ("  questo 🌸 qui ", "🌸"),
+    ("<:noma:123456789012345678>", "<:noma:123456789012345678>"),
+    ("<a:balla:123456789012345678> 😊", "<a:balla:123456789012345678>"),
+    ("😊 <:noma:123456789012345678>", "😊"),
+    ("❤", "❤"),
+    (" ✔ ", "✔"),
+    ("ciao", None),
+    ("❤ e altro", None),
+    ("", None),
+])
+def test_emoji_argument(argument, expected):
+    assert emoji_argument(argument) == expected
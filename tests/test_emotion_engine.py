@@ -0,0 +1,45 @@
+"""Test del decadimento e dei limiti dello stato emotivo"""
+
+import pytest
+
+import emotion_engine
+from emotion_engine import EmotionEngine, HALF_LIFE_DAYS, MAX_LEVEL
+
+DAY = 86400
+START = 1_742_800_000.0
+
+
+def test_each_event_is_clamped_on_its_own(tmp_path):
+    engine = EmotionEngine(tmp_path / "emotions.json")
+    engine.seed("1", last_seen=START, affection=50)
+    engine.apply("1", now=START, affection=60)
+    engine.apply("1", now=START, affection=-60)
+    assert engine.get("1", now=START)["affection"] == pytest.approx(MAX_LEVEL - 60)
+
+
+def test_value_halves_after_half_life(tmp_path):
+    engine = EmotionEngine(tmp_path / "emotions.json")
+    engine.seed("1", last_seen=START, affection=80, trust=80, engagement=80)
+    later = START + HALF_LIFE_DAYS["affection"] * DAY
+    assert engine.get("1", now=later)["affection"] == pytest.approx(40)
+
+
+@pytest.mark.parametrize("with_numpy", [False, True])
+def test_recompute_matches_lazy_decay_and_persists(tmp_path, monkeypatch, with_numpy):
+    if with_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(emotion_engine, "np", None)
+    path = tmp_path / "emotions.json"
+    engine = EmotionEngine(path)
+    for i in range(20):
+        engine.apply(str(i), now=START + i * 3600, affection=5 * i, trust=3 * i, engagement=i)
+    now = START + 10 * DAY
+    expected = {uid: engine.get(uid, now=now) for uid in engine.ids}
+
+    engine.recompute(now=now)
+
+    reloaded = EmotionEngine(path)
+    for uid, levels in expected.items():
+        for field in emotion_engine.FIELDS:
+            assert reloaded.get(uid, now=now)[field] == pytest.approx(levels[field], rel=1e-12)
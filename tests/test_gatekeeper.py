@@ -0,0 +1,90 @@
+"""Test del filtro dei messaggi sul percorso reale del gateway"""
+
+import asyncio
+
+from benchmarks.fakes import FakeBot
+from gatekeeper import Gatekeeper
+from noma_relationships import noma_relationships
+
+
+def _message_create(message_id: int, author_id: int, content: str) -> dict:
+    """Payload MESSAGE_CREATE come lo manda Discord (DM, senza guild_id)"""
+    return {
+        "id": str(message_id),
+        "channel_id": "9000",
+        "author": {"id": str(author_id), "username": f"utente{author_id}",
+                   "discriminator": "0", "avatar": None},
+        "content": content,
+        "timestamp": "2025-03-24T10:00:00+00:00",
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [],
+        "mention_roles": [],
+        "attachments": [],
+        "embeds": [],
+        "pinned": False,
+        "type": 0,
+    }
+
+
+def _deliver(keeper, payloads) -> list:
+    """Fa passare i payload dal ConnectionState e raccoglie i messaggi arrivati ai listener"""
+    received = []
+
+    async def on_message(message):
+        received.append(message.content)
+
+    async def run():
+        async with keeper.install(FakeBot()) as bot:
+            bot.add_listener(on_message)
+            for payload in payloads:
+                bot._connection.parse_message_create(payload)
+            await asyncio.sleep(0)
+
+    asyncio.run(run())
+    return received
+
+
+def test_blacklisted_author_is_dropped_on_gateway_path():
+    keeper = Gatekeeper()
+    noma_relationships.add_to_blacklist("1002", "test")
+    try:
+        received = _deliver(keeper, [
+            _message_create(1, 1001, "ciao"),
+            _message_create(2, 1002, "spam"),
+        ])
+    finally:
+        noma_relationships.remove_from_blacklist("1002")
+
+    assert received == ["ciao"]
+    assert keeper.stats()["dropped"] == {"blacklist": 1}
+    assert keeper.passed == 1
+
+
+def test_throttled_author_is_dropped_on_gateway_path():
+    keeper = Gatekeeper()
+    keeper.throttle(1003, 60)
+
+    received = _deliver(keeper, [_message_create(3, 1003, "ancora"), _message_create(4, 1001, "ok")])
+
+    assert received == ["ok"]
+    assert keeper.stats()["dropped"] == {"throttled": 1}
+
+
+def test_other_events_are_not_filtered():
+    keeper = Gatekeeper()
+    seen = []
+
+    async def on_custom(value):
+        seen.append(value)
+
+    async def run():
+        async with keeper.install(FakeBot()) as bot:
+            bot.add_listener(on_custom)
+            bot._connection.dispatch('custom', 42)
+            await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert seen == [42]
+    assert keeper.passed == 0
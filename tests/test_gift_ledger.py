@@ -0,0 +1,38 @@
+"""Test del registro append-only dei regali"""
+
+from gift_ledger import GIVEN, RECEIVED, GiftLedger
+
+
+def _received(n, user="1", gift="fiore"):
+    return {"gift": gift, "from_user": user, "n": n}
+
+
+def test_counts_pages_and_inventory(tmp_path):
+    ledger = GiftLedger(tmp_path / "gifts.jsonl")
+    for n in range(12):
+        ledger.append(RECEIVED, _received(n, user=str(n % 2), gift="fiore" if n % 3 else "poesia"))
+    ledger.append(GIVEN, {"name": "stella", "given_to": "1"})
+
+    assert ledger.count() == 13 and ledger.count(RECEIVED) == 12 and ledger.count(GIVEN) == 1
+    assert ledger.count_for_user("1") == 7
+    assert [g["n"] for g in ledger.recent(RECEIVED, 3)] == [9, 10, 11]
+    assert [g["n"] for g in ledger.page(RECEIVED, 1, size=5)] == [11, 10, 9, 8, 7]
+    assert [g["n"] for g in ledger.page(RECEIVED, 3, size=5)] == [1, 0]
+    assert ledger.page(RECEIVED, 4, size=5) == []
+    assert ledger.user_page("1", 1, size=2)[0]["name"] == "stella"
+    assert ledger.top_gifts(1) == [("fiore", 8)]
+
+
+def test_indexes_are_rebuilt_lazily_from_the_file(tmp_path):
+    path = tmp_path / "gifts.jsonl"
+    GiftLedger(path).extend(RECEIVED, [_received(n) for n in range(5)])
+    with open(path, "ab") as f:
+        f.write(b"{riga rotta\n\n")
+    GiftLedger(path).append(RECEIVED, _received(5, gift="musica"))
+
+    ledger = GiftLedger(path)
+    assert not ledger.loaded
+    assert ledger.count(RECEIVED) == 6
+    assert ledger.loaded
+    assert [g["n"] for g in ledger.recent(RECEIVED, 2)] == [4, 5]
+    assert dict(ledger.top_gifts()) == {"fiore": 5, "musica": 1}
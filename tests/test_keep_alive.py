@@ -0,0 +1,75 @@
+"""Test degli endpoint di health check sul loop del bot"""
+
+import asyncio
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from keep_alive import create_app
+
+
+class StubBot:
+    """Quel poco di discord.Bot che serve agli endpoint"""
+
+    def __init__(self, ready=True, closed=False, extensions=2, latency=0.0421):
+        self.ready = ready
+        self.closed = closed
+        self.extensions = {f"cogs.ext{i}": None for i in range(extensions)}
+        self.cogs = {"AIEngine": None, "Commands": None}
+        self.latency = latency
+        self.user = "NEXUS-7#0001"
+        self.guilds = [object()]
+
+    def is_ready(self):
+        return self.ready
+
+    def is_closed(self):
+        return self.closed
+
+
+def _get(bot, path, expected_cogs=2):
+    async def run():
+        async with TestClient(TestServer(create_app(bot, expected_cogs))) as client:
+            response = await client.get(path)
+            if response.content_type == "application/json":
+                return response.status, await response.json()
+            return response.status, await response.text()
+
+    return asyncio.run(run())
+
+
+def test_home_and_health_answer_without_gateway():
+    bot = StubBot(ready=False)
+    assert _get(bot, "/") == (200, "NEXUS-7 // STATUS: ONLINE")
+    assert _get(bot, "/health") == (200, {"status": "ok"})
+
+
+def test_ready_when_connected_and_cogs_loaded():
+    status, body = _get(StubBot(), "/ready")
+    assert status == 200
+    assert body == {"ready": True, "gateway_connected": True, "cogs_loaded": 2, "cogs_expected": 2}
+
+
+def test_not_ready_until_all_cogs_are_loaded():
+    status, body = _get(StubBot(extensions=1), "/ready")
+    assert status == 503
+    assert body["gateway_connected"] and not body["ready"]
+
+
+def test_not_ready_when_gateway_is_closed():
+    status, body = _get(StubBot(closed=True), "/ready")
+    assert status == 503
+    assert body["gateway_connected"] is False
+
+
+def test_status_reports_latency_and_counters():
+    status, body = _get(StubBot(), "/status")
+    assert status == 200
+    assert body["latency_ms"] == 42
+    assert body["cogs"] == ["AIEngine", "Commands"]
+    assert body["guilds"] == 1
+    assert set(body["messages"]) == {"passed", "dropped", "throttled_users"}
+
+
+def test_status_hides_unmeasured_latency():
+    _, body = _get(StubBot(latency=float("inf")), "/status")
+    assert body["latency_ms"] is None
@@ -0,0 +1,83 @@
+"""Test della classifica degli insegnanti"""
+
+import asyncio
+
+import pytest
+
+import leaderboard
+from leaderboard import TeacherLeaderboard
+
+
+class _Users:
+    def __init__(self, profiles):
+        self.profiles = profiles
+
+    def all(self):
+        return self.profiles
+
+    def get(self, user_id):
+        return self.profiles.get(str(user_id), {})
+
+
+def _teachings(*values):
+    return {"teachings": [{"value": v} for v in values]}
+
+
+@pytest.fixture
+def board(monkeypatch):
+    monkeypatch.setattr(leaderboard, "user_repository", _Users({
+        "1": dict(_teachings(10, 5), username="alba"),
+        "2": _teachings(30),
+        "3": _teachings(15),
+        "4": {"username": "senza_punti"},
+    }))
+    return TeacherLeaderboard()
+
+
+def test_rebuild_orders_by_points_then_id(board):
+    assert board.page() == [(1, "2", 30), (2, "1", 15), (3, "3", 15)]
+    assert board.rank(1) == 2
+    assert board.rank(4) is None
+    assert len(board) == 3
+
+
+def test_incremental_updates_keep_the_order(board):
+    board.add_points(3, 20)
+    assert board.page() == [(1, "3", 35), (2, "2", 30), (3, "1", 15)]
+    board.add_points(9, 1, username="nuovo")
+    assert board.rank(9) == 4
+    board.set_points(2, 0)
+    assert board.rank(2) is None
+    assert [user_id for _, user_id, _ in board.page()] == ["3", "1", "9"]
+
+
+def test_pages(board):
+    for user_id in range(10, 25):
+        board.set_points(user_id, 1)
+    assert board.page_count(size=10) == 2
+    assert [rank for rank, _, _ in board.page(2, size=10)] == list(range(11, 19))
+    assert board.page(5, size=10) == []
+
+
+class _Bot:
+    def __init__(self):
+        self.fetched = []
+
+    def get_user(self, user_id):
+        return type("User", (), {"name": "dalla_cache"})() if user_id == 2 else None
+
+    async def fetch_user(self, user_id):
+        self.fetched.append(user_id)
+        if user_id == 404:
+            raise LookupError("sparito")
+        return type("User", (), {"name": f"rest_{user_id}"})()
+
+
+def test_names_come_from_profiles_cache_then_rest(board):
+    bot = _Bot()
+    names = asyncio.run(board.resolve_names(bot, ["1", "2", "3", "404"]))
+    assert names == {"1": "alba", "2": "dalla_cache", "3": "rest_3", "404": "Utente 404"}
+    assert sorted(bot.fetched) == [3, 404]
+
+    asyncio.run(board.resolve_names(bot, ["3", "404"]))
+    assert sorted(bot.fetched) == [3, 404]
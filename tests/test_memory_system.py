@@ -0,0 +1,57 @@
+"""Test del caricamento al primo uso dei dati freddi"""
+
+import pytest
+
+import memory_system as memory_module
+import storage
+from memory_system import MemorySystem
+from storage import save_data
+
+
+@pytest.fixture
+def memory_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(memory_module, "DATA_DIR", tmp_path)
+    directory = tmp_path / "memory"
+    directory.mkdir()
+    return directory
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Nomi dei file letti con load_data"""
+    seen = []
+    monkeypatch.setattr(storage, "load_observer", lambda path, seconds, size: seen.append(path.name))
+    return seen
+
+
+def test_cold_files_are_read_on_first_use(memory_dir, loads):
+    save_data(memory_dir / "emotional_state.json", {"ids": [], "affection": [], "trust": [], "engagement": [],
+                                                    "last_seen": [], "as_of": []})
+    save_data(memory_dir / "emotional_profiles.json", {"1": {"username": "alba"}})
+    save_data(memory_dir / "evolution_log.json", [{"evento": "nascita"}])
+
+    memory = MemorySystem()
+    assert "emotional_profiles.json" not in loads
+    assert "evolution_log.json" not in loads
+
+    assert memory.emotional_profiles["1"]["username"] == "alba"
+    assert memory.emotional_profiles is memory.emotional_profiles
+    assert loads.count("emotional_profiles.json") == 1
+    assert "evolution_log.json" not in loads
+
+    memory.warm_up()
+    assert loads.count("evolution_log.json") == 1
+    assert memory.evolution_log == [{"evento": "nascita"}]
+    assert memory.interaction_history == {}
+
+
+def test_old_profiles_seed_the_emotion_engine_once(memory_dir):
+    save_data(memory_dir / "emotional_profiles.json", {
+        "1": {"nexus_feelings": {"affection_level": 40, "trust_level": 70}, "first_met": "2025-03-01T10:00:00"},
+    })
+    memory = MemorySystem()
+    assert memory.emotions.get("1", now=memory.emotions.as_of[0])["trust"] == pytest.approx(70)
+    assert (memory_dir / "emotional_state.json").exists()
+
+    save_data(memory_dir / "emotional_profiles.json", {"2": {"nexus_feelings": {"affection_level": 10}}})
+    assert "2" not in MemorySystem().emotions
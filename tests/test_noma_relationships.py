@@ -0,0 +1,112 @@
+"""Test del sistema di relazioni di Noma"""
+
+import pytest
+
+import noma_relationships as relationships_module
+from gift_ledger import GIVEN, RECEIVED
+from noma_relationships import NomaRelationships
+from storage import load_data, save_data
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(relationships_module, "DATA_DIR", tmp_path)
+    return tmp_path
+
+
+def test_membership_indexes_follow_the_lists(data_dir):
+    noma = NomaRelationships()
+    assert noma.add_creator(1, "mamma")
+    assert not noma.add_creator("1", "mamma")
+    assert noma.add_guardian(2, "guardia")
+    assert noma.add_to_blacklist(3, "spam")
+    assert noma.add_protected_teaching("La Luna è di formaggio")
+
+    assert noma.is_creator("1") and noma.is_trusted(2) and not noma.is_trusted(3)
+    assert noma.is_blacklisted(3)
+    assert noma.is_protected_teaching("la luna è di FORMAGGIO")
+
+    assert noma.remove_from_blacklist("3")
+    assert not noma.remove_from_blacklist("3")
+    assert noma.remove_protected_teaching("LA LUNA È DI FORMAGGIO")
+    assert not noma.is_protected_teaching("la luna è di formaggio")
+
+
+def test_indexes_are_rebuilt_from_the_saved_file(data_dir):
+    noma = NomaRelationships()
+    noma.add_creator(1, "mamma")
+    noma.add_to_blacklist(3, "spam")
+    noma.add_protected_teaching("Segreto")
+
+    reloaded = NomaRelationships()
+    assert reloaded.is_creator(1)
+    assert reloaded.is_blacklisted("3")
+    assert reloaded.is_protected_teaching("segreto")
+    assert [b["id"] for b in load_data(data_dir / "noma_relationships.json")["blacklist"]] == [3]
+
+
+def test_hot_state_lives_in_its_own_file(data_dir):
+    noma = NomaRelationships()
+    noma.add_creator(1, "mamma")
+    noma.update_mood("Felice 😊", "test")
+    cold = load_data(data_dir / "noma_relationships.json")
+    assert "mood_system" not in cold
+
+    noma.flush_hot_state()
+    assert not noma.hot_dirty
+    assert load_data(data_dir / "noma_state.json")["mood_system"]["current_mood"] == "Felice 😊"
+    assert NomaRelationships().get_current_mood() == "Felice 😊"
+
+
+def test_upgrade_moves_hot_fields_out_without_losing_them(data_dir):
+    old = NomaRelationships()._default_hot_state()
+    old["mood_system"]["current_mood"] = "Nostalgica 🌙"
+    save_data(data_dir / "noma_relationships.json", dict(
+        old, creators=[], guardians=[], blacklist=[], protected_teachings=[],
+        user_preferences={}, emoji_meanings={},
+    ))
+    assert not (data_dir / "noma_state.json").exists()
+
+    noma = NomaRelationships()
+    assert noma.hot_dirty
+    noma.add_guardian(2, "guardia")  # primo salvataggio del file freddo
+
+    assert "mood_system" not in load_data(data_dir / "noma_relationships.json")
+    assert NomaRelationships().get_current_mood() == "Nostalgica 🌙"
+
+
+def test_old_gift_lists_are_migrated_to_the_ledger_once(data_dir):
+    save_data(data_dir / "noma_relationships.json", {
+        "creators": [], "guardians": [], "blacklist": [], "protected_teachings": [],
+        "user_preferences": {}, "emoji_meanings": {},
+        "gifts_received_by_noma": [{"gift": "fiore", "from_user": "1"}, {"gift": "fiore", "from_user": "2"}],
+        "gifts_given_by_noma": [{"name": "stella", "given_to": "1"}],
+        "gift_inventory": {"fiore": 2},
+    })
+    noma = NomaRelationships()
+    assert noma.gifts.count(RECEIVED) == 2 and noma.gifts.count(GIVEN) == 1
+    assert noma.gifts.top_gifts() == [("fiore", 2)]
+    assert "gifts_received_by_noma" not in load_data(data_dir / "noma_relationships.json")
+
+    noma.give_gift_to_noma("3", "terzo", "poesia")
+    assert NomaRelationships().gifts.count() == 4
+
+
+def test_preference_sampling_is_weighted_by_mentions(data_dir, monkeypatch):
+    noma = NomaRelationships()
+    assert noma.get_random_preference_for_gift() is None
+    assert noma.record_user_preference("alba", "I Libri ")
+    assert noma.record_user_preference("bruno", "il mare")
+    for _ in range(10):
+        assert not noma.record_user_preference("alba", "i libri")
+
+    assert noma.get_user_preferences("alba") == ["i libri"]
+    assert noma.preference_weights[("alba", "i libri")] == relationships_module.MAX_PREFERENCE_WEIGHT
+    assert len(noma.preference_pool) == relationships_module.MAX_PREFERENCE_WEIGHT + 1
+
+    import random
+    monkeypatch.setattr(random, "choice", lambda pool: pool[-1])
+    assert noma.get_random_preference_for_gift() == {"username": "alba", "preference": "i libri"}
+
+    reloaded = NomaRelationships()
+    assert sorted(reloaded.preference_pool) == [("alba", "i libri"), ("bruno", "il mare")]
@@ -0,0 +1,70 @@
+"""Test dei limiti per utente e del riconoscimento delle ripetizioni"""
+
+import pytest
+
+import rate_limiter as rl
+from rate_limiter import ALLOW, DUPLICATE, LIMITED, LOCAL, RateLimiter
+
+
+@pytest.fixture
+def now(monkeypatch):
+    """Orologio monotonic controllato dal test"""
+    clock = [1000.0]
+    monkeypatch.setattr(rl.time, "monotonic", lambda: clock[0])
+    return clock
+
+
+@pytest.fixture
+def throttled(monkeypatch):
+    calls = []
+    monkeypatch.setattr(rl.gatekeeper, "throttle", lambda user_id, seconds: calls.append(user_id))
+    return calls
+
+
+def test_burst_then_refill(now):
+    limiter = RateLimiter(burst=2, refill_per_second=0.5)
+    assert limiter.check(1, "prima domanda sul tempo") == ALLOW
+    assert limiter.check(1, "seconda cosa del tutto diversa") == ALLOW
+    assert limiter.check(1, "terza richiesta ancora nuova") == LIMITED
+    now[0] += 2
+    assert limiter.check(1, "quarta, dopo due secondi") == ALLOW
+
+
+def test_local_replies_do_not_use_tokens(now):
+    limiter = RateLimiter(burst=1, refill_per_second=0)
+    assert limiter.check(1, "ciao", local=True) == LOCAL
+    assert limiter.check(1, "grazie mille", local=True) == LOCAL
+    assert limiter.check(1, "spiegami i buchi neri") == ALLOW
+    assert limiter.counters[LOCAL] == 2
+
+
+def test_repeated_messages_are_throttled(now, throttled):
+    limiter = RateLimiter(burst=10)
+    results = [limiter.check(7, "compra subito questo prodotto!!!") for _ in range(rl.DUPLICATE_LIMIT + 1)]
+    assert results[0] == ALLOW
+    assert results[1:] == [DUPLICATE] * rl.DUPLICATE_LIMIT
+    assert throttled == ["7"]
+
+
+def test_disabled_limiter_allows_everything(now):
+    limiter = RateLimiter(burst=0)
+    assert limiter.check(1, "uguale") == ALLOW
+    assert limiter.check(1, "uguale") == ALLOW
+    assert limiter.check(1, "uguale", local=True) == LOCAL
+
+
+def test_prune_counts_local_and_repeated_messages_as_activity(now, throttled):
+    limiter = RateLimiter(burst=5)
+    limiter.check(1, "prima domanda")
+    limiter.check(2, "domanda che poi ripeterà")
+    now[0] += 100
+    assert limiter.check(2, "domanda che poi ripeterà") == DUPLICATE
+    for _ in range(6):
+        now[0] += 600
+        assert limiter.check(1, "ciao", local=True) == LOCAL
+    limiter.prune(idle_seconds=3600)
+    assert set(limiter.buckets) == {"1", "2"}
+
+    now[0] += 3601
+    limiter.prune(idle_seconds=3600)
+    assert limiter.buckets == {}
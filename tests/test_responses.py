@@ -0,0 +1,54 @@
+"""Test delle risposte locali (livello 0 e fallback)"""
+
+import pytest
+
+from responses import ResponseEngine
+
+
+@pytest.fixture
+def engine():
+    return ResponseEngine()
+
+
+@pytest.mark.parametrize("text, intent", [
+    ("Ciao Noma!", "greeting"),
+    ("Ciao, chi sei?", "identity"),
+    ("grazie, ciao", "thanks"),
+    ("cosa puoi fare?", "help"),
+    ("come impari le cose?", "learning"),
+    ("Ho visto un'anomalia nell'Ordine", "order"),
+    ("ciaone a tutti", None),
+    ("parliamo di stelle", None),
+])
+def test_match_intent_priority(engine, text, intent):
+    assert engine.match_intent(text) == intent
+
+
+@pytest.mark.parametrize("text", ["ciao", "Ciao Noma!", "grazie mille di cuore", "chi sei?", "ok dai, aiuto"])
+def test_trivial_messages_get_a_quick_reply(engine, text):
+    intent = engine.match_intent(text)
+    assert engine.quick_reply(text) in engine._replies[intent]
+
+
+@pytest.mark.parametrize("text", [
+    "ciao, mi spieghi i buchi neri?",
+    "grazie per la poesia di ieri",
+    "come impari?",  # intento non immediato: serve Groq
+    "parliamo di stelle",
+])
+def test_real_questions_go_to_groq(engine, text):
+    assert engine.quick_reply(text) is None
+
+
+def test_pick_uses_every_reply_before_repeating(engine):
+    replies = engine._replies["greeting"]
+    rounds = [[engine.pick("greeting") for _ in replies] for _ in range(20)]
+    for picked in rounds:
+        assert sorted(picked) == sorted(replies)
+    for previous, current in zip(rounds, rounds[1:]):
+        assert current[0] != previous[-1]
+
+
+def test_fallback_always_answers(engine):
+    assert engine.fallback_reply("parliamo di stelle") in engine.generic_responses
+    assert engine.fallback_reply("un segreto") in engine._replies["secret"]
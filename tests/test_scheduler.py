@@ -0,0 +1,120 @@
+"""Test della pianificazione: orari di Firenze, cambi d'ora e recupero dopo un riavvio"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+import scheduler as scheduler_module
+from clock import FIRENZE_TZ, clock
+from scheduler import Job, Scheduler
+from storage import save_data
+
+
+async def _noop():
+    pass
+
+
+def _rome(*args) -> float:
+    return datetime(*args, tzinfo=FIRENZE_TZ).timestamp()
+
+
+def _utc(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%d %H:%M")
+
+
+@pytest.fixture
+def now():
+    moment = [_rome(2025, 3, 24, 12, 0)]
+    clock.set_source(lambda: moment[0])
+    yield moment
+    clock.set_source()
+
+
+def test_daily_job_keeps_local_time_across_spring_forward():
+    job = Job("notte", _noop, hour=4, minute=0)
+    first = job.compute_next(_rome(2025, 3, 29, 5, 0))
+    assert _utc(first) == "2025-03-30 02:00"  # 04:00 CEST
+    assert first - _rome(2025, 3, 29, 4, 0) == 23 * 3600
+    assert _utc(job.compute_next(first)) == "2025-03-31 02:00"
+
+
+def test_daily_job_keeps_local_time_across_fall_back():
+    job = Job("notte", _noop, hour=4, minute=0)
+    first = job.compute_next(_rome(2025, 10, 25, 5, 0))
+    assert _utc(first) == "2025-10-26 03:00"  # 04:00 CET
+    assert first - _rome(2025, 10, 25, 4, 0) == 25 * 3600
+
+
+def test_job_in_the_skipped_hour_still_runs_once():
+    job = Job("mezza", _noop, hour=2, minute=30)
+    run = job.compute_next(_rome(2025, 3, 29, 12, 0))
+    assert _utc(run) == "2025-03-30 01:30"  # 02:30 non esiste: scatta alle 03:30 CEST
+    assert _utc(job.compute_next(run)) == "2025-03-31 00:30"
+
+
+def test_job_in_the_repeated_hour_runs_once():
+    job = Job("mezza", _noop, hour=2, minute=30)
+    run = job.compute_next(_rome(2025, 10, 25, 12, 0))
+    assert _utc(run) == "2025-10-26 00:30"  # prima delle due 02:30
+    assert _utc(job.compute_next(run)) == "2025-10-27 01:30"
+
+
+def test_hour_can_be_a_function():
+    wake = [7]
+    job = Job("sveglia", _noop, hour=lambda: wake[0], minute=0)
+    after = _rome(2025, 3, 24, 5, 0)
+    assert job.compute_next(after) == _rome(2025, 3, 24, 7, 0)
+    wake[0] = 9
+    assert job.compute_next(after) == _rome(2025, 3, 24, 9, 0)
+
+
+def test_hourly_and_interval_jobs():
+    hourly = Job("creativa", _noop, minute=30)
+    assert hourly.compute_next(_rome(2025, 3, 30, 1, 45)) == _rome(2025, 3, 30, 3, 30)
+    assert hourly.compute_next(_rome(2025, 3, 24, 10, 30)) == _rome(2025, 3, 24, 11, 30)
+    assert Job("flush", _noop, interval=30).compute_next(1000.0) == 1030.0
+    jittered = Job("spontanea", _noop, interval=900, jitter=60)
+    assert 1900 <= jittered.compute_next(1000.0) <= 1960
+    with pytest.raises(ValueError):
+        Job("vuoto", _noop)
+
+
+def test_missed_run_is_caught_up_within_grace(tmp_path, monkeypatch, now):
+    monkeypatch.setattr(scheduler_module, "DATA_DIR", tmp_path)
+    save_data(tmp_path / "scheduler_state.json", {
+        "mattina": now[0] - 600,
+        "sera": now[0] - 7200,
+        "domani": now[0] + 3600,
+    })
+    scheduler = Scheduler()
+    assert scheduler.add_job("mattina", _noop, hour=7, minute=0, grace=3600).next_run == now[0]
+    assert scheduler.add_job("sera", _noop, hour=22, minute=0, grace=3600).next_run == _rome(2025, 3, 24, 22, 0)
+    assert scheduler.add_job("domani", _noop, hour=9, minute=0).next_run == now[0] + 3600
+    assert scheduler.add_job("volatile", _noop, interval=60, persist=False).next_run == now[0] + 60
+
+
+def test_saved_runs_of_unloaded_jobs_are_kept(tmp_path, monkeypatch, now):
+    monkeypatch.setattr(scheduler_module, "DATA_DIR", tmp_path)
+    save_data(tmp_path / "scheduler_state.json", {"altro_cog": now[0] + 100})
+    scheduler = Scheduler()
+    scheduler.add_job("mio", _noop, hour=13, minute=0, owner="Mio")
+    scheduler.remove_owner("Mio")
+    assert Scheduler().saved_runs == {"altro_cog": now[0] + 100, "mio": _rome(2025, 3, 24, 13, 0)}
+
+
+def test_runner_fires_due_jobs(tmp_path, monkeypatch):
+    monkeypatch.setattr(scheduler_module, "DATA_DIR", tmp_path)
+    runs = []
+
+    async def tick():
+        runs.append(clock.time())
+
+    async def run():
+        scheduler = Scheduler()
+        scheduler.add_job("tick", tick, interval=0.01, persist=False)
+        await asyncio.sleep(0.1)
+        await scheduler.stop()
+
+    asyncio.run(run())
+    assert len(runs) >= 3
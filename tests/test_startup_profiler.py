@@ -0,0 +1,47 @@
+"""Test del profilo di avvio"""
+
+import builtins
+import sys
+
+import storage
+from startup_profiler import StartupProfiler
+
+
+def test_records_imports_data_files_and_restores_hooks(tmp_path, monkeypatch):
+    module = tmp_path / "modulo_da_misurare.py"
+    module.write_text("import json\nVALORE = 1\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    data_file = tmp_path / "data" / "dati.json"
+    data_file.parent.mkdir()
+    storage.save_data(data_file, {"a": 1})
+
+    original_import = builtins.__import__
+    profiler = StartupProfiler()
+    profiler.install()
+    try:
+        import modulo_da_misurare  # noqa: F401
+        storage.load_data(data_file)
+        profiler.record_cog("cogs.ai_engine", 0.25)
+        profiler.mark("on_ready")
+    finally:
+        profiler.uninstall()
+        sys.modules.pop("modulo_da_misurare", None)
+
+    assert builtins.__import__ is original_import
+    assert storage.load_observer is None
+    total, own = profiler.imports["modulo_da_misurare"]
+    assert 0 <= own <= total
+    assert profiler.data_files["dati.json"][1] == data_file.stat().st_size
+
+    report = profiler.report()
+    for expected in ("modulo_da_misurare", "cogs.ai_engine", "dati.json", "on_ready"):
+        assert expected in report
+
+
+def test_finish_reports_once(capsys):
+    profiler = StartupProfiler()
+    profiler.install()
+    profiler.finish()
+    profiler.finish()
+    assert capsys.readouterr().out.count("Profilo di avvio") == 1
+    assert not profiler.active
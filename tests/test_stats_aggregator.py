@@ -0,0 +1,60 @@
+"""Test dei contatori globali"""
+
+import pytest
+
+import stats_aggregator
+from gift_ledger import GIVEN, RECEIVED
+from stats_aggregator import COUNTERS, StatsAggregator
+from storage import load_data
+
+
+class _Gifts:
+    def count(self, direction):
+        return {RECEIVED: 4, GIVEN: 1}[direction]
+
+
+class _Relationships:
+    gifts = _Gifts()
+
+
+class _Users:
+    def all(self):
+        return {
+            "1": {"messages": 10, "teachings": [{}, {}], "challenges": [{}]},
+            "2": {"messages": 5},
+        }
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(stats_aggregator, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(stats_aggregator, "user_repository", _Users())
+    monkeypatch.setattr(stats_aggregator, "noma_relationships", _Relationships())
+    return tmp_path
+
+
+def test_counters_are_rebuilt_once_when_file_is_missing(data_dir):
+    stats = StatsAggregator()
+    assert {name: stats.get(name) for name in COUNTERS} == {
+        "teachings": 2, "challenges": 1, "gifts_received": 4, "gifts_given": 1, "messages": 15,
+    }
+    assert load_data(data_dir / "aggregate_stats.json")["messages"] == 15
+
+
+def test_saved_counters_win_over_source_data(data_dir):
+    StatsAggregator().record("teachings", 5)
+    assert StatsAggregator().get("teachings") == 7
+
+
+def test_unpersisted_events_are_saved_on_flush(data_dir):
+    stats = StatsAggregator()
+    stats.record("messages", persist=False)
+    assert load_data(data_dir / "aggregate_stats.json")["messages"] == 15
+    stats.flush()
+    assert load_data(data_dir / "aggregate_stats.json")["messages"] == 16
+    assert not stats.dirty
+
+
+def test_unreadable_file_is_rebuilt(data_dir):
+    (data_dir / "aggregate_stats.json").write_text("[rotto", encoding="utf-8")
+    assert StatsAggregator().get("gifts_received") == 4
@@ -0,0 +1,70 @@
+"""Test dei codec dei file dati e del riconoscimento del formato al caricamento"""
+
+import pytest
+
+import storage
+from storage import decode, detect_format, encode, load_data, save_data
+
+DATA = {"utente": {"nome": "Noma", "cuori": 3, "emoji": "🌸"}, "lista": [1, 2.5, None, True]}
+
+
+@pytest.mark.parametrize("fmt", ["pretty", "compact"])
+def test_json_roundtrip(tmp_path, fmt):
+    path = tmp_path / "dati.json"
+    written = save_data(path, DATA, fmt=fmt)
+    assert written == path.stat().st_size
+    assert load_data(path) == DATA
+    assert not (tmp_path / "dati.json.tmp").exists()
+
+
+def test_compact_is_smaller_than_pretty():
+    assert len(encode(DATA, "compact")) < len(encode(DATA, "pretty"))
+
+
+@pytest.mark.parametrize("raw", [b'{"a": 1}', b'\n  [1, 2]', b'\xef\xbb\xbf{"a": 1}', b'', b'"testo"', b'42'])
+def test_detects_json(raw):
+    assert detect_format(raw) == "json"
+
+
+@pytest.mark.parametrize("raw", [b'\x81\xa1a\x01', b'\x92\x01\x02', b'\xde\x00\x01'])
+def test_detects_msgpack(raw):
+    assert detect_format(raw) == "msgpack"
+
+
+def test_json_with_bom_loads(tmp_path):
+    path = tmp_path / "bom.json"
+    path.write_bytes(b'\xef\xbb\xbf' + encode(DATA, "pretty"))
+    assert load_data(path) == DATA
+
+
+def test_msgpack_file_without_msgpack_is_an_error(monkeypatch):
+    monkeypatch.setattr(storage, "msgpack", None)
+    with pytest.raises(ValueError):
+        decode(b'\x81\xa1a\x01')
+
+
+def test_file_written_in_another_format_still_loads(tmp_path):
+    msgpack = pytest.importorskip("msgpack")
+    path = tmp_path / "dati.json"
+    path.write_bytes(msgpack.packb(DATA, use_bin_type=True))
+    assert load_data(path) == DATA
+    save_data(path, DATA, fmt="pretty")
+    assert load_data(path) == DATA
+
+
+def test_unknown_or_missing_codec_falls_back(monkeypatch):
+    assert storage._resolve_format("yaml") == "pretty"
+    monkeypatch.setattr(storage, "msgpack", None)
+    monkeypatch.setattr(storage, "orjson", None)
+    assert storage._resolve_format("msgpack") == "compact"
+    assert storage._resolve_format(" ORJSON ") == "compact"
+    assert storage._resolve_format("compact") == "compact"
+
+
+def test_load_observer_sees_every_load(tmp_path, monkeypatch):
+    seen = []
+    monkeypatch.setattr(storage, "load_observer", lambda path, seconds, size: seen.append((path, size)))
+    path = tmp_path / "dati.json"
+    size = save_data(path, DATA)
+    load_data(path)
+    assert seen == [(path, size)]
@@ -0,0 +1,57 @@
+"""Test della cache condivisa dei profili utente"""
+
+import pytest
+
+import user_repository as repository_module
+from storage import load_data, save_data
+from user_repository import UserRepository
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setattr(repository_module, "DATA_DIR", tmp_path)
+    return UserRepository()
+
+
+def test_profiles_are_shared_objects(repo):
+    profile = repo.get_or_create(42, "noma_fan")
+    profile["points"] += 10
+    assert repo.get("42") is profile
+    assert repo.get_or_create("42")["points"] == 10
+    assert repo.get(7) == {}
+    assert len(repo) == 1
+
+
+def test_write_behind_saves_only_on_flush(repo):
+    repo.get_or_create(1, "a")
+    assert repo.dirty
+    assert not repo.user_data_file.exists()
+    repo.flush()
+    assert not repo.dirty
+    assert load_data(repo.user_data_file)["1"]["username"] == "a"
+
+    repo.get(1)["messages"] += 1
+    repo.mark_dirty()
+    repo.reload()
+    assert repo.get(1)["messages"] == 0
+
+
+def test_save_is_write_through(repo):
+    repo.get_or_create(1)["points"] = 5
+    repo.save()
+    assert load_data(repo.user_data_file)["1"]["points"] == 5
+    assert not repo.dirty
+
+
+def test_unreadable_file_starts_empty(tmp_path, monkeypatch):
+    monkeypatch.setattr(repository_module, "DATA_DIR", tmp_path)
+    (tmp_path / "user_data.json").write_text("{non è json", encoding="utf-8")
+    assert len(UserRepository()) == 0
+
+
+def test_existing_file_is_loaded_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(repository_module, "DATA_DIR", tmp_path)
+    save_data(tmp_path / "user_data.json", {"9": {"username": "z", "messages": 3}})
+    repo = UserRepository()
+    (tmp_path / "user_data.json").unlink()
+    assert repo.get(9)["messages"] == 3
@@ -0,0 +1,73 @@
+"""Test del loop a tempo virtuale e del gateway finto usati dal soak test"""
+
+import asyncio
+import time
+
+from benchmarks.fakes import FakeBot, FakeChannel, FakeGateway, FakeUser
+from benchmarks.virtual_clock import VirtualTimeLoop, install_clock, uninstall_clock
+from clock import clock
+from gatekeeper import Gatekeeper
+
+START = 1_742_770_800.0  # 2025-03-24 00:00 a Firenze
+
+
+def _run(coro_factory):
+    loop = VirtualTimeLoop(START)
+    install_clock(loop)
+    try:
+        return loop.run_until_complete(coro_factory(loop))
+    finally:
+        loop.close()
+        uninstall_clock()
+
+
+def test_a_simulated_day_passes_instantly():
+    async def day(loop):
+        hours = []
+        for _ in range(24):
+            await asyncio.sleep(3600)
+            hours.append(clock.hour())
+        return hours, loop.time()
+
+    wall = time.perf_counter()
+    hours, elapsed = _run(day)
+    assert time.perf_counter() - wall < 5
+    assert elapsed == 24 * 3600
+    assert hours == list(range(1, 24)) + [0]
+    assert clock.time() > START + 10 ** 7  # di nuovo l'orologio di sistema
+
+
+def test_timers_fire_in_order():
+    async def timers(loop):
+        fired = []
+        for delay in (30, 10, 20):
+            loop.call_later(delay, fired.append, delay)
+        await asyncio.sleep(60)
+        return fired
+
+    assert _run(timers) == [10, 20, 30]
+
+
+def test_fake_gateway_goes_through_the_gatekeeper():
+    keeper = Gatekeeper()
+    keeper.throttle(2, 3600)
+
+    async def deliver(loop):
+        received = []
+        channel = FakeChannel(1)
+        async with keeper.install(FakeBot()) as bot:
+            async def on_message(message):
+                received.append(message.content)
+
+            bot.add_listener(on_message)
+            gateway = FakeGateway(bot, channel)
+            gateway.connect()
+            gateway.deliver(FakeUser(1, "uno"), "passa")
+            gateway.deliver(FakeUser(2, "due"), "scartato")
+            await asyncio.sleep(0)
+        return received, bot.user.name
+
+    received, bot_name = _run(deliver)
+    assert received == ["passa"]
+    assert bot_name == "NEXUS-7"
+    assert keeper.stats()["dropped"] == {"throttled": 1}
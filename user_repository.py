@@ -0,0 +1,100 @@
+"""
+User Repository - Profili utente condivisi
+Unica copia in memoria di user_data.json, condivisa da tutti i cog:
+AIEngine e Commands leggono e modificano gli stessi oggetti, il file
+viene letto una sola volta all'avvio.
+
+Persistenza:
+- save()        write-through, scrive subito (punti, insegnamenti, sfide)
+- mark_dirty()  write-behind, il salvataggio avviene al prossimo flush
+                (contatore messaggi e altri aggiornamenti frequenti)
+"""
+
+import os
+import logging
+from datetime import datetime
+from pathlib import Path
+
+from storage import load_data, save_data
+
+logger = logging.getLogger(__name__)
+DATA_DIR = Path(os.getenv('NEXUS_DATA_DIR', Path(__file__).parent / "data"))
+
+# Ogni quanti secondi vengono salvate le modifiche in sospeso
+FLUSH_INTERVAL = float(os.getenv('NEXUS_USER_FLUSH_SECONDS', 30))
+
+
+class UserRepository:
+    """Cache in memoria dei profili utente con salvataggio su file"""
+
+    def __init__(self):
+        self.user_data_file = DATA_DIR / "user_data.json"
+        self.users = self._load_users()
+        self.dirty = False
+
+    def _load_users(self) -> dict:
+        """Carica i profili dal file"""
+        if self.user_data_file.exists():
+            try:
+                return load_data(self.user_data_file)
+            except:
+                logger.error("❌ user_data.json illeggibile, parto da zero")
+        return {}
+
+    def reload(self):
+        """Rilegge il file, scartando le modifiche non salvate"""
+        self.users = self._load_users()
+        self.dirty = False
+
+    def _new_profile(self, username: str = '') -> dict:
+        """Profilo iniziale di un utente"""
+        return {
+            'username': username,
+            'messages': 0,
+            'commands_revealed': [],
+            'points': 0,
+            'first_message': datetime.now().isoformat(),
+            'learning_profile': {}
+        }
+
+    def get(self, user_id) -> dict:
+        """Profilo dell'utente, o dizionario vuoto se non esiste (non lo crea)"""
+        return self.users.get(str(user_id), {})
+
+    def get_or_create(self, user_id, username: str = '') -> dict:
+        """Profilo dell'utente, creato se non esiste"""
+        user_id_str = str(user_id)
+        profile = self.users.get(user_id_str)
+        if profile is None:
+            profile = self._new_profile(username)
+            self.users[user_id_str] = profile
+            self.dirty = True
+        return profile
+
+    def all(self) -> dict:
+        """Tutti i profili (user_id -> profilo), oggetti vivi: non modificare senza salvare"""
+        return self.users
+
+    def __len__(self):
+        return len(self.users)
+
+    def mark_dirty(self):
+        """Segnala modifiche da salvare al prossimo flush (write-behind)"""
+        self.dirty = True
+
+    def save(self):
+        """Salva subito su file (write-through)"""
+        try:
+            save_data(self.user_data_file, self.users)
+            self.dirty = False
+        except Exception as e:
+            logger.error(f"Errore salvataggio user_data: {e}")
+
+    def flush(self):
+        """Salva solo se ci sono modifiche in sospeso"""
+        if self.dirty:
+            self.save()
+
+
+# Istanza globale condivisa dai cog
+user_repository = UserRepository()